@@ -32,6 +32,8 @@ import subprocess
 import tempfile
 import os
 import argparse
+import functools
+import hashlib
 import json
 import shutil
 from pathlib import Path
@@ -48,10 +50,21 @@ DEFAULT_EASING = "linear"   # linear, easeOut, easeInOut, or spring
 DEFAULT_BG_COLOR = "#2d3436"  # Soft dark gray (can also use hex like #1a1a2e)
 
 REMOTION_DIR = Path(__file__).parent / "video_effects"
+BG_CACHE_DIR = Path(tempfile.gettempdir()) / "pan3d_bg_cache"
 
 
 def get_video_info(input_path: str) -> dict:
-    """Get video metadata using ffprobe."""
+    """Get video metadata using ffprobe.
+
+    Results are cached per (path, size, mtime), so repeat calls for an
+    unchanged file skip the ffprobe run.
+    """
+    st = os.stat(input_path)
+    return dict(_probe_video_info(os.path.abspath(input_path), st.st_size, st.st_mtime_ns))
+
+
+@functools.lru_cache(maxsize=256)
+def _probe_video_info(input_path: str, size: int, mtime_ns: int) -> dict:
     cmd = [
         "ffprobe", "-v", "error",
         "-select_streams", "v:0",
@@ -92,7 +105,10 @@ def extract_frames(input_path: str, output_dir: str, start: float, duration: flo
         "-loglevel", "error",
         os.path.join(output_dir, "frame_%04d.jpg")
     ]
-    subprocess.run(cmd, check=True)
+    try:
+        subprocess.run(cmd, check=True, timeout=120)
+    except subprocess.TimeoutExpired:
+        raise TimeoutError("Frame extraction timed out after 2 minutes")
 
     # Count frames
     frame_count = len([f for f in os.listdir(output_dir) if f.startswith("frame_")])
@@ -100,6 +116,40 @@ def extract_frames(input_path: str, output_dir: str, start: float, duration: flo
     return frame_count
 
 
+def prepare_bg_image(bg_image: str, width: int, height: int) -> str:
+    """Scale/crop a background image to the output size once and cache it.
+
+    Mirrors the composition's objectFit: cover, so the browser only decodes
+    an output-sized image instead of e.g. a full-resolution photo per render.
+    Cached in BG_CACHE_DIR by (image contents, width, height); falls back to
+    the original path if FFmpeg fails.
+    """
+    with open(bg_image, "rb") as f:
+        digest = hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+    cached = BG_CACHE_DIR / f"{digest}_{width}x{height}.png"
+    if cached.exists():
+        return str(cached)
+
+    BG_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    tmp_path = cached.with_suffix(f".{os.getpid()}.tmp.png")
+    cmd = [
+        "ffmpeg", "-y", "-loglevel", "error",
+        "-i", bg_image,
+        "-vf", f"scale={width}:{height}:force_original_aspect_ratio=increase,crop={width}:{height}",
+        "-frames:v", "1",
+        str(tmp_path)
+    ]
+    try:
+        subprocess.run(cmd, check=True, timeout=30)
+        os.replace(tmp_path, cached)
+    except (subprocess.SubprocessError, OSError) as e:
+        print(f"⚠️  Could not pre-scale background image ({e}), using original")
+        if tmp_path.exists():
+            tmp_path.unlink()
+        return bg_image
+    return str(cached)
+
+
 def render_transition(
     frame_dir: str,
     output_path: str,
@@ -116,16 +166,51 @@ def render_transition(
     playback_rate: float,
     easing: str = "easeOut",
     bg_color: str = DEFAULT_BG_COLOR,
-    bg_image: str = None
+    bg_image: str = None,
+    renderer=None,
 ) -> None:
-    """Render the 3D transition using Remotion."""
+    """Render the 3D transition using Remotion.
+
+    Both paths render the ``Pan3D`` composition in video_effects/src/Pan3D.tsx
+    with the same props. If ``renderer`` is given (an object with
+    ``render(job)``, e.g. the worker's persistent Remotion server), the job is
+    handed to it instead of spawning ``npx remotion render``.
+    """
     print(f"🎬 Rendering 3D transition...")
 
     # Calculate output frames
     output_frames = int(output_duration * fps)
 
-    # Create a temporary composition file
-    comp_file = os.path.join(frame_dir, "DynamicComp.tsx")
+    if bg_image and os.path.exists(bg_image):
+        bg_image = prepare_bg_image(bg_image, width, height)
+    else:
+        bg_image = None
+
+    # fps is passed through as-is so 29.97fps sources stay 29.97
+    props = {
+        "width": width,
+        "height": height,
+        "fps": fps,
+        "durationInFrames": output_frames,
+        "frameCount": frame_count,
+        "swivelStart": swivel_start,
+        "swivelEnd": swivel_end,
+        "tiltStart": tilt_start,
+        "tiltEnd": tilt_end,
+        "perspective": perspective,
+        "easing": easing,
+        "bgColor": bg_color,
+    }
+
+    if renderer is not None:
+        renderer.render({
+            "frameDir": os.path.abspath(frame_dir),
+            "output": os.path.abspath(output_path),
+            "bgImage": os.path.abspath(bg_image) if bg_image else None,
+            "props": props,
+        })
+        print(f"✅ Rendered to {output_path}")
+        return
 
     # We need to copy frames to Remotion's public folder
     public_dir = REMOTION_DIR / "public" / "frames"
@@ -139,142 +224,34 @@ def render_transition(
     print(f"   ✅ Frames copied")
 
     # Copy background image if provided
-    bg_image_filename = None
-    if bg_image and os.path.exists(bg_image):
+    props["bgImage"] = None
+    if bg_image:
         bg_image_filename = "bg_image" + Path(bg_image).suffix
         shutil.copy(bg_image, public_dir / bg_image_filename)
+        props["bgImage"] = f"frames/{bg_image_filename}"
         print(f"🖼️  Using background image: {bg_image}")
 
-    # Generate easing code based on type
-    if easing == "spring":
-        easing_code = '''
-  const progress = spring({
-    frame,
-    fps: ''' + str(int(fps)) + ''',
-    config: { damping: 15, stiffness: 80, mass: 0.5 },
-  });'''
-        easing_import = "spring"
-    elif easing == "easeInOut":
-        easing_code = '''
-  const progress = interpolate(frame, [0, durationInFrames], [0, 1], {
-    extrapolateRight: "clamp",
-    easing: Easing.inOut(Easing.cubic),
-  });'''
-        easing_import = ""
-    elif easing == "easeOut":
-        easing_code = '''
-  const progress = interpolate(frame, [0, durationInFrames], [0, 1], {
-    extrapolateRight: "clamp",
-    easing: Easing.out(Easing.cubic),
-  });'''
-        easing_import = ""
-    else:  # linear (default)
-        easing_code = '''
-  const progress = interpolate(frame, [0, durationInFrames], [0, 1], {
-    extrapolateRight: "clamp",
-  });'''
-        easing_import = ""
-
-    # Create dynamic composition
-    spring_import = ", spring" if easing == "spring" else ""
-
-    # Background rendering - either image or color
-    if bg_image_filename:
-        bg_jsx = f'''<Img
-        src={{staticFile("frames/{bg_image_filename}")}}
-        style={{{{ width: "100%", height: "100%", objectFit: "cover", position: "absolute" }}}}
-      />'''
-        bg_style = "backgroundColor: 'transparent'"
-    else:
-        bg_jsx = ""
-        bg_style = f'backgroundColor: "{bg_color}"'
-
-    dynamic_root = f'''
-import React from "react";
-import {{ Composition, AbsoluteFill, Img, interpolate, useCurrentFrame, useVideoConfig, Easing, staticFile{spring_import} }} from "remotion";
-
-const VideoTransition3D: React.FC = () => {{
-  const frame = useCurrentFrame();
-  const {{ durationInFrames, fps }} = useVideoConfig();
-
-  const frameCount = {frame_count};
-  const swivelStart = {swivel_start};
-  const swivelEnd = {swivel_end};
-  const tiltStart = {tilt_start};
-  const tiltEnd = {tilt_end};
-  const perspectiveVal = {perspective};
-
-  // Which source frame to show (scale to avoid freezing if frame counts differ)
-  const durationFrames = Math.max(durationInFrames - 1, 1);
-  const frameRatio = (frameCount - 1) / durationFrames;
-  const sourceFrameIndex = Math.min(Math.floor(frame * frameRatio), frameCount - 1);
-
-  // Progress for 3D effect{easing_code}
-
-  const swivelDeg = interpolate(progress, [0, 1], [swivelStart, swivelEnd]);
-  const tiltDeg = interpolate(progress, [0, 1], [tiltStart, tiltEnd]);
-  const scaleVal = 0.985; // 1.5% zoom out
-  const translateY = 0; // No vertical offset
-
-  const frameNum = String(sourceFrameIndex + 1).padStart(4, "0");
-  const frameFilename = "frame_" + frameNum + ".jpg";
-
-  return (
-    <AbsoluteFill style={{{{ perspective: perspectiveVal + "px", {bg_style} }}}}>
-      {bg_jsx}
-      <AbsoluteFill style={{{{
-        transform: "translateY(" + translateY + "%) rotateY(" + swivelDeg + "deg) rotateX(" + tiltDeg + "deg) scale(" + scaleVal + ")",
-        transformStyle: "preserve-3d",
-      }}}}>
-        <Img
-          src={{staticFile("frames/" + frameFilename)}}
-          style={{{{ width: "100%", height: "100%", objectFit: "cover" }}}}
-        />
-      </AbsoluteFill>
-    </AbsoluteFill>
-  );
-}};
-
-export const DynamicRoot: React.FC = () => {{
-  return (
-    <Composition
-      id="Pan3D"
-      component={{VideoTransition3D}}
-      durationInFrames={{{output_frames}}}
-      fps={{{int(fps)}}}
-      width={{{width}}}
-      height={{{height}}}
-    />
-  );
-}};
-'''
-
-    # Write dynamic root
-    print(f"   Writing React component...")
-    dynamic_root_path = REMOTION_DIR / "src" / "DynamicRoot.tsx"
-    with open(dynamic_root_path, "w") as f:
-        f.write(dynamic_root)
-    print(f"   ✅ DynamicRoot.tsx written")
-
-    # Write dynamic index
-    dynamic_index_path = REMOTION_DIR / "src" / "dynamic-index.ts"
-    with open(dynamic_index_path, "w") as f:
-        f.write('import { registerRoot } from "remotion";\nimport { DynamicRoot } from "./DynamicRoot";\nregisterRoot(DynamicRoot);')
-    print(f"   ✅ dynamic-index.ts written")
+    # Write render props
+    props_path = os.path.abspath(os.path.join(frame_dir, "props.json"))
+    with open(props_path, "w") as f:
+        json.dump(props, f)
+
+    entry_point = REMOTION_DIR / "src" / "pan3d-index.ts"
 
     # Render - use absolute path for output
     abs_output_path = os.path.abspath(output_path)
 
     cmd = [
         "npx", "remotion", "render",
-        str(dynamic_index_path),
+        str(entry_point),
         "Pan3D",
         abs_output_path,
+        f"--props={props_path}",
         "--log", "info",  # Show progress
     ]
 
     print(f"   🎬 Starting Remotion render...", flush=True)
-    print(f"      Command: npx remotion render {dynamic_index_path} Pan3D {abs_output_path}", flush=True)
+    print(f"      Command: npx remotion render {entry_point} Pan3D {abs_output_path}", flush=True)
     print(f"      Working directory: {REMOTION_DIR}", flush=True)
     print(f"      (This may take 30-60 seconds...)", flush=True)
     print(flush=True)
@@ -293,7 +270,7 @@ export const DynamicRoot: React.FC = () => {{
             raise RuntimeError(f"Remotion render failed with exit code {result.returncode}")
     
     except subprocess.TimeoutExpired:
-        raise RuntimeError("Remotion render timed out after 2 minutes")
+        raise TimeoutError("Remotion render timed out after 2 minutes")
 
     print()
     print(f"✅ Rendered to {output_path}")
@@ -318,6 +295,7 @@ def create_transition(
     bg_color: str = DEFAULT_BG_COLOR,
     bg_image: str = None,
     sample_entire_video: bool = False,
+    renderer=None,
 ) -> None:
     """Create a 3D pan transition from a video segment.
     
@@ -337,6 +315,7 @@ def create_transition(
         bg_color: Background color hex code
         bg_image: Background image path (optional)
         sample_entire_video: If True, samples frames evenly from entire video (0 to end)
+        renderer: Optional persistent renderer passed through to render_transition
     """
 
     # Get video info
@@ -394,6 +373,7 @@ def create_transition(
             easing=easing,
             bg_color=bg_color,
             bg_image=bg_image,
+            renderer=renderer,
         )
 
 
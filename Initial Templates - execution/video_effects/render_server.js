@@ -0,0 +1,104 @@
+#!/usr/bin/env node
+/**
+ * Persistent Remotion renderer for pan_3d_transition.
+ *
+ * Bundles src/pan3d-index.ts once and keeps a Chromium instance open, then
+ * renders one transition per JSON line read from stdin. Replies are written
+ * to stdout as one JSON line each ({"id", "ok", "error"?}); all logging goes
+ * to stderr so stdout stays a clean protocol channel.
+ *
+ * Job fields: id, frameDir, output, bgImage (path or null), props (see
+ * Pan3DProps in src/Pan3D.tsx; bgImage is filled in here).
+ */
+const fs = require("fs");
+const path = require("path");
+const readline = require("readline");
+const { bundle } = require("@remotion/bundler");
+const { openBrowser, renderMedia, selectComposition } = require("@remotion/renderer");
+
+const COMPOSITION_ID = "Pan3D";
+
+const log = (...args) => console.error("[render-server]", ...args);
+const reply = (msg) => process.stdout.write(JSON.stringify(msg) + "\n");
+
+async function renderJob(serveUrl, browser, job) {
+  // staticFile() resolves against the bundle's own public/ copy, so frames
+  // are staged there rather than in the project public/ folder.
+  const framesDir = path.join(serveUrl, "public", "frames");
+  fs.rmSync(framesDir, { recursive: true, force: true });
+  fs.mkdirSync(framesDir, { recursive: true });
+
+  for (const name of fs.readdirSync(job.frameDir)) {
+    if (name.startsWith("frame_")) {
+      fs.copyFileSync(path.join(job.frameDir, name), path.join(framesDir, name));
+    }
+  }
+
+  let bgImage = null;
+  if (job.bgImage) {
+    const bgName = "bg_image" + path.extname(job.bgImage);
+    fs.copyFileSync(job.bgImage, path.join(framesDir, bgName));
+    bgImage = "frames/" + bgName;
+  }
+
+  const inputProps = { ...job.props, bgImage };
+  const composition = await selectComposition({
+    serveUrl,
+    id: COMPOSITION_ID,
+    inputProps,
+    puppeteerInstance: browser,
+  });
+
+  await renderMedia({
+    composition,
+    serveUrl,
+    codec: "h264",
+    outputLocation: job.output,
+    inputProps,
+    puppeteerInstance: browser,
+    videoImageFormat: "jpeg",
+    overwrite: true,
+  });
+}
+
+async function main() {
+  log("Bundling composition...");
+  const serveUrl = await bundle({
+    entryPoint: path.join(__dirname, "src", "pan3d-index.ts"),
+  });
+  const browser = await openBrowser("chrome");
+
+  const shutdown = async () => {
+    await browser.close({ silent: true }).catch(() => {});
+    process.exit(0);
+  };
+  process.on("SIGTERM", shutdown);
+  process.on("SIGINT", shutdown);
+
+  log("Ready");
+  reply({ ready: true });
+
+  const rl = readline.createInterface({ input: process.stdin });
+  for await (const line of rl) {
+    if (!line.trim()) continue;
+    let job = null;
+    try {
+      job = JSON.parse(line);
+      const started = Date.now();
+      await renderJob(serveUrl, browser, job);
+      log(`Rendered ${job.output} in ${((Date.now() - started) / 1000).toFixed(1)}s`);
+      reply({ id: job.id, ok: true });
+    } catch (err) {
+      log("Render failed:", err);
+      reply({ id: job && job.id, ok: false, error: String((err && err.message) || err) });
+    }
+  }
+
+  // stdin closed: parent went away
+  await shutdown();
+}
+
+main().catch((err) => {
+  log("Fatal:", err);
+  process.exit(1);
+});
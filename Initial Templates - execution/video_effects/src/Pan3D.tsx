@@ -0,0 +1,140 @@
+import React from "react";
+import {
+  AbsoluteFill,
+  type CalculateMetadataFunction,
+  Composition,
+  Img,
+  interpolate,
+  useCurrentFrame,
+  useVideoConfig,
+  spring,
+  Easing,
+  staticFile,
+} from "remotion";
+
+// The 3D pan transition rendered by pan_3d_transition.py. Both the
+// `npx remotion render` path (--props) and render_server.js (inputProps)
+// render this one composition, so a warm server never has to rebundle.
+
+export type Pan3DProps = {
+  width: number;
+  height: number;
+  fps: number;
+  durationInFrames: number;
+  frameCount: number;
+  swivelStart: number;
+  swivelEnd: number;
+  tiltStart: number;
+  tiltEnd: number;
+  perspective: number;
+  easing: "linear" | "easeOut" | "easeInOut" | "spring";
+  bgColor: string;
+  bgImage: string | null;
+};
+
+export const Pan3D: React.FC<Pan3DProps> = ({
+  frameCount,
+  swivelStart,
+  swivelEnd,
+  tiltStart,
+  tiltEnd,
+  perspective,
+  easing,
+  bgColor,
+  bgImage,
+}) => {
+  const frame = useCurrentFrame();
+  const { durationInFrames, fps } = useVideoConfig();
+
+  // Which source frame to show (scale to avoid freezing if frame counts differ)
+  const durationFrames = Math.max(durationInFrames - 1, 1);
+  const frameRatio = (frameCount - 1) / durationFrames;
+  const sourceFrameIndex = Math.min(Math.floor(frame * frameRatio), frameCount - 1);
+
+  // Progress for 3D effect
+  let progress: number;
+  if (easing === "spring") {
+    progress = spring({
+      frame,
+      fps,
+      config: { damping: 15, stiffness: 80, mass: 0.5 },
+    });
+  } else {
+    progress = interpolate(frame, [0, durationInFrames], [0, 1], {
+      extrapolateRight: "clamp",
+      easing:
+        easing === "easeOut"
+          ? Easing.out(Easing.cubic)
+          : easing === "easeInOut"
+            ? Easing.inOut(Easing.cubic)
+            : undefined,
+    });
+  }
+
+  const swivelDeg = interpolate(progress, [0, 1], [swivelStart, swivelEnd]);
+  const tiltDeg = interpolate(progress, [0, 1], [tiltStart, tiltEnd]);
+  const scaleVal = 0.985; // 1.5% zoom out
+
+  const frameNum = String(sourceFrameIndex + 1).padStart(4, "0");
+  const frameFilename = "frame_" + frameNum + ".jpg";
+
+  return (
+    <AbsoluteFill
+      style={{
+        perspective: perspective + "px",
+        backgroundColor: bgImage ? "transparent" : bgColor,
+      }}
+    >
+      {bgImage ? (
+        <Img
+          src={staticFile(bgImage)}
+          style={{ width: "100%", height: "100%", objectFit: "cover", position: "absolute" }}
+        />
+      ) : null}
+      <AbsoluteFill
+        style={{
+          transform: "rotateY(" + swivelDeg + "deg) rotateX(" + tiltDeg + "deg) scale(" + scaleVal + ")",
+          transformStyle: "preserve-3d",
+        }}
+      >
+        <Img
+          src={staticFile("frames/" + frameFilename)}
+          style={{ width: "100%", height: "100%", objectFit: "cover" }}
+        />
+      </AbsoluteFill>
+    </AbsoluteFill>
+  );
+};
+
+// Size, frame rate and length come from the per-render props.
+const calculateMetadata: CalculateMetadataFunction<Pan3DProps> = ({ props }) => ({
+  width: props.width,
+  height: props.height,
+  fps: props.fps,
+  durationInFrames: props.durationInFrames,
+});
+
+export const Pan3DRoot: React.FC = () => {
+  return (
+    <Composition
+      id="Pan3D"
+      component={Pan3D}
+      calculateMetadata={calculateMetadata}
+      defaultProps={{
+        width: 1920,
+        height: 1080,
+        fps: 30,
+        durationInFrames: 30,
+        frameCount: 1,
+        swivelStart: 3.5,
+        swivelEnd: -3.5,
+        tiltStart: 1.7,
+        tiltEnd: 1.7,
+        perspective: 1000,
+        easing: "linear",
+        bgColor: "#2d3436",
+        bgImage: null,
+      }}
+    />
+  );
+};
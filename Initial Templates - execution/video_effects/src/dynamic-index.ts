@@ -1,3 +0,0 @@
-import { registerRoot } from "remotion";
-import { DynamicRoot } from "./DynamicRoot";
-registerRoot(DynamicRoot);
\ No newline at end of file
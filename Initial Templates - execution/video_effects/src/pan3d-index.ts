@@ -0,0 +1,3 @@
+import { registerRoot } from "remotion";
+import { Pan3DRoot } from "./Pan3D";
+registerRoot(Pan3DRoot);
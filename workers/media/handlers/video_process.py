@@ -163,7 +163,9 @@ class VideoProcessHandler(BaseHandler):
                                 min_confidence=retake_min_confidence,
                                 prefer_sentence_boundaries=retake_prefer_sentence_boundaries,
                                 model=llm_model,
-                                vad_segments=vad_result.get("speech_segments")
+                                vad_segments=vad_result.get("speech_segments"),
+                                use_llm_cache=True,
+                                shortcut_quick_fix=True
                             )
                             
                             if cut_instructions:
@@ -172,7 +174,8 @@ class VideoProcessHandler(BaseHandler):
                                     input_path=vad_output_path,
                                     output_path=cuts_output_path,
                                     cut_instructions=cut_instructions,
-                                    original_segments=vad_result.get("speech_segments", [])
+                                    original_segments=vad_result.get("speech_segments", []),
+                                    video_duration=after_vad_duration_ms / 1000
                                 )
                                 
                                 if cuts_result["success"]:
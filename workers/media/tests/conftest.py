@@ -0,0 +1,51 @@
+"""
+Shared fixtures for tests that run real ffmpeg/ffprobe.
+
+Media fixtures skip the requesting test when either binary is missing.
+"""
+import json
+import shutil
+import subprocess
+
+import pytest
+
+
+def probe_video(path: str, entries: str, extra=()) -> dict:
+    """Return ffprobe JSON for the first video stream of path."""
+    result = subprocess.run(
+        ["ffprobe", "-v", "error", "-select_streams", "v:0", *extra,
+         "-show_entries", entries, "-of", "json", path],
+        capture_output=True, text=True, check=True
+    )
+    return json.loads(result.stdout)
+
+
+def decode_errors(path: str) -> str:
+    """Decode path in full and return anything ffmpeg reported."""
+    result = subprocess.run(
+        ["ffmpeg", "-v", "error", "-i", path, "-f", "null", "-"],
+        capture_output=True, text=True
+    )
+    return result.stderr.strip() if result.returncode == 0 else result.stderr or "decode failed"
+
+
+@pytest.fixture
+def ffmpeg_tools():
+    if not (shutil.which("ffmpeg") and shutil.which("ffprobe")):
+        pytest.skip("ffmpeg and ffprobe are required")
+
+
+@pytest.fixture
+def h264_fixture(ffmpeg_tools, tmp_path):
+    """Six seconds of 30fps High-profile H.264 with a keyframe every second."""
+    path = str(tmp_path / "source.mp4")
+    subprocess.run(
+        ["ffmpeg", "-y", "-v", "error",
+         "-f", "lavfi", "-i", "testsrc2=size=320x240:rate=30:duration=6",
+         "-f", "lavfi", "-i", "sine=frequency=440:duration=6",
+         "-c:v", "libx264", "-profile:v", "high", "-pix_fmt", "yuv420p",
+         "-g", "30", "-keyint_min", "30", "-sc_threshold", "0",
+         "-c:a", "aac", "-shortest", path],
+        capture_output=True, check=True
+    )
+    return path
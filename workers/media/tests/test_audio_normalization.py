@@ -0,0 +1,94 @@
+"""
+Tests for loudness normalization.
+
+The parser tests are pure Python; the normalization tests run real
+ffmpeg/ffprobe (see conftest.py) and are skipped when either is missing.
+"""
+import os
+import subprocess
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from utils.audio_normalization import (
+    _measure_loudness,
+    _parse_loudnorm_stats,
+    normalize_audio_loudness,
+)
+
+
+def _loudnorm_output(**stats) -> str:
+    values = {
+        "input_i": "-27.61",
+        "input_tp": "-4.47",
+        "input_lra": "18.06",
+        "input_thresh": "-39.20",
+        "target_offset": "0.58",
+        **stats,
+    }
+    body = ",\n".join(f'\t"{key}" : "{value}"' for key, value in values.items())
+    return "[Parsed_loudnorm_0 @ 0x0] \n{\n" + body + "\n}\n"
+
+
+# ===== Test Loudnorm Stats Parsing =====
+
+def test_parse_loudnorm_stats():
+    """Measurements are returned as floats."""
+    stats = _parse_loudnorm_stats(_loudnorm_output())
+
+    assert stats["input_i"] == -27.61
+    assert stats["target_offset"] == 0.58
+
+
+def test_parse_loudnorm_stats_silent_track():
+    """Silent audio reports -inf/inf, which falls back to a single pass."""
+    output = _loudnorm_output(
+        input_i="-inf", input_tp="-inf", input_thresh="-inf", target_offset="inf"
+    )
+
+    assert _parse_loudnorm_stats(output) is None
+
+
+def test_parse_loudnorm_stats_missing_json():
+    assert _parse_loudnorm_stats("Conversion failed!") is None
+
+
+# ===== Test Normalization on Real Media =====
+
+
+def _tone(path: str, gain_db: float) -> str:
+    subprocess.run(
+        ["ffmpeg", "-y", "-v", "error",
+         "-f", "lavfi", "-i", "sine=frequency=440:duration=5",
+         "-af", f"volume={gain_db}dB", "-c:a", "aac", path],
+        capture_output=True, check=True
+    )
+    return path
+
+
+def test_normalize_two_pass_reaches_target(ffmpeg_tools, tmp_path):
+    """A quiet input is measured once and brought to the target loudness."""
+    source = _tone(str(tmp_path / "quiet.m4a"), -20)
+    output = str(tmp_path / "out.m4a")
+
+    result = normalize_audio_loudness(source, output)
+
+    assert result["status"] == "applied"
+    measured = _measure_loudness(output, -15.0, -1.5, 11.0)
+    assert measured["input_i"] == pytest.approx(-15.0, abs=1.0)
+
+
+def test_normalize_skips_input_within_tolerance(ffmpeg_tools, tmp_path):
+    """Inputs already at the target are copied without re-encoding."""
+    source = _tone(str(tmp_path / "quiet.m4a"), -20)
+    normalized = str(tmp_path / "normalized.m4a")
+    normalize_audio_loudness(source, normalized)
+    output = str(tmp_path / "out.m4a")
+
+    result = normalize_audio_loudness(normalized, output, tolerance_lufs=1.0)
+
+    assert result["status"] == "skipped_within_tolerance"
+    with open(normalized, "rb") as a, open(output, "rb") as b:
+        assert a.read() == b.read()
@@ -0,0 +1,126 @@
+"""
+Tests for the intro transition overlay and Remotion render server.
+
+The overlay tests run real ffmpeg/ffprobe on generated fixtures (see
+conftest.py) and are skipped when either binary is missing; the render
+server smoke test needs Node.js and an installed video_effects project.
+"""
+import os
+import shutil
+import subprocess
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from conftest import decode_errors, probe_video
+from utils.intro_transition import (
+    _VIDEO_EFFECTS_DIR,
+    RemotionServer,
+    RemotionServerError,
+    _load_pan_module,
+    _overlay_segmented,
+)
+
+
+@pytest.fixture
+def transition_fixture(ffmpeg_tools, tmp_path):
+    """A one-second overlay clip the size of h264_fixture."""
+    path = str(tmp_path / "transition.mp4")
+    subprocess.run(
+        ["ffmpeg", "-y", "-v", "error",
+         "-f", "lavfi", "-i", "smptebars=size=320x240:rate=30:duration=1",
+         "-c:v", "libx264", "-pix_fmt", "yuv420p", path],
+        capture_output=True, check=True
+    )
+    return path
+
+
+def test_overlay_segmented_output_plays_back(h264_fixture, transition_fixture, tmp_path):
+    """Spliced overlay output decodes cleanly and keeps the source's frames and profile."""
+    output = str(tmp_path / "out.mp4")
+
+    assert _overlay_segmented(h264_fixture, transition_fixture, output, 1.5, 2.5)
+    assert decode_errors(output) == ""
+
+    stream = probe_video(
+        output, "stream=profile,pix_fmt,nb_read_frames", extra=["-count_frames"]
+    )["streams"][0]
+    assert stream["profile"] == "High"
+    assert stream["pix_fmt"] == "yuv420p"
+    assert abs(int(stream["nb_read_frames"]) - 180) <= 1
+
+
+def test_overlay_segmented_skips_non_h264(ffmpeg_tools, transition_fixture, tmp_path):
+    """Sources that can't be joined as H.264 MPEG-TS use the full overlay."""
+    source = str(tmp_path / "source.mp4")
+    subprocess.run(
+        ["ffmpeg", "-y", "-v", "error",
+         "-f", "lavfi", "-i", "testsrc2=size=320x240:rate=30:duration=3",
+         "-c:v", "mpeg4", source],
+        capture_output=True, check=True
+    )
+    output = str(tmp_path / "out.mp4")
+
+    assert not _overlay_segmented(source, transition_fixture, output, 1.0, 2.0)
+    assert not os.path.exists(output)
+
+
+# ===== Test Remotion Rendering =====
+
+class _RecordingRenderer:
+    def __init__(self):
+        self.jobs = []
+
+    def render(self, job):
+        self.jobs.append(job)
+
+
+def test_render_transition_passes_fps_through(tmp_path):
+    """Fractional frame rates reach the composition unchanged."""
+    _load_pan_module()
+    pan = sys.modules["pan_3d_transition"]
+    renderer = _RecordingRenderer()
+
+    pan.render_transition(
+        str(tmp_path), str(tmp_path / "out.mp4"), frame_count=10,
+        width=1280, height=720, fps=29.97, output_duration=2.0,
+        swivel_start=3.5, swivel_end=-3.5, tilt_start=1.7, tilt_end=1.7,
+        perspective=1000, playback_rate=1.0, renderer=renderer,
+    )
+
+    props = renderer.jobs[0]["props"]
+    assert props["fps"] == 29.97
+    assert props["durationInFrames"] == 59
+    assert (props["width"], props["height"]) == (1280, 720)
+
+
+@pytest.mark.skipif(os.name == "nt", reason="render server is POSIX-only")
+def test_remotion_server_malformed_reply(tmp_path):
+    """A non-JSON reply stops the server and raises the npx-fallback error."""
+    server = RemotionServer(tmp_path)
+    server._proc = subprocess.Popen(
+        [sys.executable, "-c", "print('Bundling...'); import time; time.sleep(30)"],
+        stdout=subprocess.PIPE, text=True
+    )
+    proc = server._proc
+
+    with pytest.raises(RemotionServerError):
+        server._read_reply(10)
+
+    assert server._proc is None
+    assert proc.wait(timeout=10) is not None
+
+
+def test_remotion_server_starts():
+    """render_server.js bundles the Pan3D composition and reports ready."""
+    if not (shutil.which("node") and (_VIDEO_EFFECTS_DIR / "node_modules" / "@remotion" / "renderer").exists()):
+        pytest.skip("Node.js and video_effects dependencies are required")
+
+    server = RemotionServer(_VIDEO_EFFECTS_DIR)
+    try:
+        server._ensure_started()
+        assert server._proc.poll() is None
+    finally:
+        server.stop()
@@ -26,7 +26,12 @@ from utils.llm_cuts import (
     detect_retake_pattern,
     generate_fallback_cuts,
     merge_overlapping_cuts,
-    find_nearest_sentence_boundary
+    find_nearest_sentence_boundary,
+    build_transcript_excerpt,
+    _call_llm_batch,
+    _count_tokens,
+    _get_token_encoding,
+    CHARS_PER_TOKEN_ESTIMATE
 )
 
 
@@ -180,6 +185,26 @@ def test_extract_context_window_empty():
     assert end_idx == 0
 
 
+def test_build_transcript_excerpt_token_budget():
+    """Test excerpt trimming keeps words closest to the focus range."""
+    words = [
+        {"word": f"word{i}", "start": i * 0.4, "end": i * 0.4 + 0.3}
+        for i in range(500)
+    ]
+    
+    full = build_transcript_excerpt(words, 0.0, 200.0)
+    trimmed = build_transcript_excerpt(
+        words, 0.0, 200.0, max_tokens=300, focus_range=(100.0, 101.0)
+    )
+    
+    assert len(full.splitlines()) == 500
+    lines = trimmed.splitlines()
+    assert 0 < len(lines) < 500
+    assert "[100.00s - 100.30s] word250" in lines
+    assert lines[0] != full.splitlines()[0]
+    assert lines[-1] != full.splitlines()[-1]
+
+
 # ===== Test Sentence Boundary Detection =====
 
 def test_identify_sentence_boundaries(sample_transcript):
@@ -482,6 +507,44 @@ def test_analyze_retake_cuts_json_parse_error_fallback(mock_openai_class, sample
     assert all(cut["method"] == "fallback_heuristic" for cut in cuts)
 
 
+@patch('utils.llm_cuts.OpenAI')
+def test_call_llm_batch_requires_batches_api(mock_openai_class):
+    """SDKs without client.batches fail before anything is uploaded."""
+    mock_client = MagicMock(spec=["files", "chat"])
+    mock_openai_class.return_value = mock_client
+
+    with pytest.raises(RuntimeError):
+        _call_llm_batch("gpt-4o", "test-key", {1: "prompt"})
+
+    mock_client.files.create.assert_not_called()
+
+
+@patch('utils.llm_cuts.OpenAI')
+def test_call_llm_batch_deletes_input_file_on_failure(mock_openai_class):
+    """A failed batch removes its uploaded input file."""
+    mock_client = MagicMock()
+    mock_openai_class.return_value = mock_client
+    mock_client.files.create.return_value.id = "file-123"
+    mock_client.batches.create.side_effect = Exception("quota exceeded")
+
+    with pytest.raises(Exception):
+        _call_llm_batch("gpt-4o", "test-key", {1: "prompt"})
+
+    mock_client.files.delete.assert_called_once_with("file-123")
+
+
+@patch('utils.llm_cuts.tiktoken')
+def test_count_tokens_estimates_when_encoding_unavailable(mock_tiktoken):
+    """A failed BPE download falls back to the character estimate."""
+    mock_tiktoken.encoding_for_model.side_effect = OSError("network unreachable")
+    _get_token_encoding.cache_clear()
+    try:
+        text = "word " * 40
+        assert _count_tokens(text, "gpt-4o") == len(text) // CHARS_PER_TOKEN_ESTIMATE + 1
+    finally:
+        _get_token_encoding.cache_clear()
+
+
 # ===== Test Edge Cases =====
 
 def test_analyze_retake_cuts_empty_matches():
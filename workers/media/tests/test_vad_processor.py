@@ -0,0 +1,97 @@
+"""
+Tests for VAD segment concatenation helpers.
+
+The smart-cut test at the bottom runs real ffmpeg/ffprobe on a generated
+H.264 fixture (see conftest.py) and is skipped when either is missing.
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from conftest import decode_errors, probe_video
+from utils.vad_processor import (
+    _concatenate_smart_cut,
+    _plan_smart_cut,
+    matched_encoder_args,
+)
+
+
+# ===== Test Smart Cut Planning =====
+
+def test_plan_smart_cut_copies_whole_gops():
+    """Only the partial GOPs at segment edges are re-encoded."""
+    keyframes = [0.0, 1.0, 2.0, 3.0, 4.0]
+    plan = _plan_smart_cut([(0.5, 3.5)], keyframes)
+
+    assert plan == [(0.5, 1.0, False), (1.0, 3.0, True), (3.0, 3.5, False)]
+
+
+def test_plan_smart_cut_keyframe_aligned():
+    """Segments on keyframes are copied without edge encodes."""
+    plan = _plan_smart_cut([(1.0, 3.0)], [0.0, 1.0, 2.0, 3.0])
+
+    assert plan == [(1.0, 3.0, True)]
+
+
+def test_plan_smart_cut_short_segment_reencoded():
+    """A segment without a whole GOP inside is re-encoded entirely."""
+    plan = _plan_smart_cut([(1.2, 1.8)], [0.0, 1.0, 2.0])
+
+    assert plan == [(1.2, 1.8, False)]
+
+
+# ===== Test Matched Encoder Args =====
+
+def test_matched_encoder_args_match_source():
+    """Edge encodes follow the source's profile, level, pix_fmt and rate."""
+    args = matched_encoder_args({
+        "codec_name": "h264",
+        "profile": "High",
+        "level": 40,
+        "pix_fmt": "yuv420p",
+        "r_frame_rate": "30000/1001",
+        "sample_aspect_ratio": "1:1",
+    })
+
+    assert args[args.index("-profile:v") + 1] == "high"
+    assert args[args.index("-level:v") + 1] == "4.0"
+    assert args[args.index("-pix_fmt") + 1] == "yuv420p"
+    assert args[args.index("-r") + 1] == "30000/1001"
+    assert "-aspect" not in args
+
+
+def test_matched_encoder_args_anamorphic():
+    """Non-square pixels carry over through the display aspect ratio."""
+    args = matched_encoder_args({
+        "profile": "Main",
+        "pix_fmt": "yuv420p",
+        "sample_aspect_ratio": "4:3",
+        "display_aspect_ratio": "16:9",
+    })
+
+    assert args[args.index("-aspect") + 1] == "16:9"
+
+
+def test_matched_encoder_args_unknown_profile():
+    """Profiles libx264 can't produce disable smart cut."""
+    assert matched_encoder_args({"profile": "Extended", "pix_fmt": "yuv420p"}) is None
+
+
+# ===== Test Smart Cut on Real Media =====
+
+def test_smart_cut_output_plays_back(h264_fixture, tmp_path):
+    """Spliced output decodes cleanly with the expected frames and profile."""
+    output = str(tmp_path / "cut.mp4")
+    segments = [(0.5, 2.5), (3.2, 5.5)]
+
+    assert _concatenate_smart_cut(h264_fixture, segments, output, has_audio=True)
+    assert decode_errors(output) == ""
+
+    stream = probe_video(
+        output, "stream=profile,pix_fmt,nb_read_frames", extra=["-count_frames"]
+    )["streams"][0]
+    assert stream["profile"] == "High"
+    assert stream["pix_fmt"] == "yuv420p"
+    expected_frames = round(sum(end - start for start, end in segments) * 30)
+    assert abs(int(stream["nb_read_frames"]) - expected_frames) <= 1
@@ -1,7 +1,9 @@
 """
 Audio normalization utilities for YouTube loudness targets.
 """
+import json
 import logging
+import math
 import shutil
 import subprocess
 
@@ -11,6 +13,7 @@ DEFAULT_TARGET_LUFS = -15.0
 DEFAULT_TRUE_PEAK = -1.5
 DEFAULT_LRA = 11.0
 DEFAULT_AUDIO_BITRATE = "192k"
+DEFAULT_LUFS_TOLERANCE = 0.5
 
 
 def _has_audio_stream(input_path: str) -> bool:
@@ -37,6 +40,70 @@ def _has_audio_stream(input_path: str) -> bool:
     return bool(result.stdout.strip())
 
 
+def _measure_loudness(
+    input_path: str,
+    target_lufs: float,
+    true_peak_db: float,
+    lra: float,
+) -> dict | None:
+    """
+    Measure loudness with an analysis-only loudnorm pass.
+
+    Returns:
+        Dict with the loudnorm measurements as floats (`input_i`, `input_tp`,
+        `input_lra`, `input_thresh`, `target_offset`), or None if measurement
+        failed.
+    """
+    filter_arg = (
+        f"loudnorm=I={target_lufs}:TP={true_peak_db}:LRA={lra}:print_format=json"
+    )
+    cmd = [
+        "ffmpeg", "-hide_banner", "-nostats",
+        "-i", input_path,
+        "-vn",
+        "-af", filter_arg,
+        "-f", "null", "-",
+    ]
+    try:
+        result = subprocess.run(cmd, capture_output=True, text=True)
+    except FileNotFoundError:
+        return None
+
+    stats = _parse_loudnorm_stats(result.stderr or "")
+    if result.returncode != 0 or stats is None:
+        logger.warning("Loudness measurement failed for %s", input_path)
+        return None
+    return stats
+
+
+def _parse_loudnorm_stats(stderr: str) -> dict | None:
+    """
+    Parse the JSON block loudnorm prints at the end of an analysis pass.
+
+    Silent tracks report `-inf`/`inf`, which the second pass rejects, so any
+    non-finite value returns None and the caller uses a single dynamic pass.
+    """
+    json_start = stderr.rfind("{")
+    json_end = stderr.rfind("}")
+    if json_start == -1 or json_end < json_start:
+        return None
+
+    try:
+        stats = json.loads(stderr[json_start:json_end + 1])
+        measured = {
+            key: float(stats[key])
+            for key in ("input_i", "input_tp", "input_lra", "input_thresh", "target_offset")
+        }
+    except (ValueError, KeyError) as e:
+        logger.warning("Could not parse loudness measurement: %s", e)
+        return None
+
+    if not all(math.isfinite(value) for value in measured.values()):
+        logger.info("Loudness measurement is not finite (silent audio?)")
+        return None
+    return measured
+
+
 def normalize_audio_loudness(
     input_path: str,
     output_path: str,
@@ -44,15 +111,21 @@ def normalize_audio_loudness(
     true_peak_db: float = DEFAULT_TRUE_PEAK,
     lra: float = DEFAULT_LRA,
     audio_bitrate: str = DEFAULT_AUDIO_BITRATE,
+    tolerance_lufs: float = DEFAULT_LUFS_TOLERANCE,
 ) -> dict:
     """
     Normalize audio loudness using FFmpeg loudnorm filter.
 
+    The input is measured first. Inputs already within `tolerance_lufs` of
+    the target (and under the true peak limit) are copied unchanged instead
+    of re-encoding the audio; otherwise the measurement feeds a linear
+    second loudnorm pass. If measuring fails, a single dynamic pass is used.
+
     Returns:
         Dict with success status, normalization status, and settings.
     """
     if not _has_audio_stream(input_path):
-        shutil.copy(input_path, output_path)
+        shutil.copyfile(input_path, output_path)
         return {
             "success": True,
             "normalized": False,
@@ -60,7 +133,42 @@ def normalize_audio_loudness(
             "note": "No audio stream detected; copied input without changes.",
         }
 
+    measured = _measure_loudness(input_path, target_lufs, true_peak_db, lra)
+    if (
+        measured
+        and abs(measured["input_i"] - target_lufs) < tolerance_lufs
+        and measured["input_tp"] <= true_peak_db
+    ):
+        logger.info(
+            "Audio already at %.1f LUFS (target %.1f); skipping normalization",
+            measured["input_i"],
+            target_lufs,
+        )
+        shutil.copyfile(input_path, output_path)
+        return {
+            "success": True,
+            "normalized": False,
+            "status": "skipped_within_tolerance",
+            "note": "Audio loudness already within tolerance; copied input without changes.",
+            "measured_i": measured["input_i"],
+            "measured_tp": measured["input_tp"],
+            "target_lufs": target_lufs,
+            "true_peak_db": true_peak_db,
+            "tolerance_lufs": tolerance_lufs,
+        }
+
     filter_arg = f"loudnorm=I={target_lufs}:TP={true_peak_db}:LRA={lra}"
+    if measured:
+        # Second pass of two-pass loudnorm: reuse the measurement so the gain
+        # is applied linearly instead of re-analyzing on the fly
+        filter_arg += (
+            f":measured_I={measured['input_i']}"
+            f":measured_TP={measured['input_tp']}"
+            f":measured_LRA={measured['input_lra']}"
+            f":measured_thresh={measured['input_thresh']}"
+            f":offset={measured['target_offset']}"
+            ":linear=true"
+        )
     cmd = [
         "ffmpeg", "-y",
         "-i", input_path,
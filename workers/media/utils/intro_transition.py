@@ -7,25 +7,195 @@ the original audio track. This approach is simpler and faster than splitting/ins
 Requirements:
 - Node.js (for Remotion rendering)
 - Remotion dependencies installed in "Initial Templates - execution/video_effects/"
+
+Set REMOTION_RENDER_SERVER=true to render through a persistent Node process
+(video_effects/render_server.js) that keeps the Remotion bundle and Chromium
+warm between videos, instead of a cold `npx remotion render` per call.
+The server needs select() on pipes, so on Windows the setting is ignored and
+transitions always render with npx.
 """
+import atexit
+import hashlib
 import importlib.util
+import itertools
+import json
 import logging
+import select
 import subprocess
 import os
+import shutil
 import sys
 import tempfile
+import threading
 from pathlib import Path
 
+from utils.vad_processor import (
+    SMART_CUT_ENABLED,
+    get_duration,
+    matched_encoder_args,
+    probe_video_stream,
+)
+
 logger = logging.getLogger(__name__)
 
+_PROJECT_ROOT = Path(__file__).resolve().parents[3]
+_EXECUTION_DIR = _PROJECT_ROOT / "Initial Templates - execution"
+_VIDEO_EFFECTS_DIR = _EXECUTION_DIR / "video_effects"
+
+REMOTION_RENDER_SERVER_ENABLED = os.getenv("REMOTION_RENDER_SERVER", "").lower() in ("1", "true", "yes")
+REMOTION_SERVER_STARTUP_TIMEOUT = 180  # bundling + Chromium launch
+REMOTION_SERVER_RENDER_TIMEOUT = 120
+TRANSITION_CACHE_DIR = Path(os.getenv("WORKER_TEMP_DIR") or os.getenv("TEMP_DIR") or "/tmp/yt-worker") / "transition_cache"
+TRANSITION_CACHE_MAX_FILES = 32
+TRANSITION_CACHE_SAMPLES = 64
+TRANSITION_CACHE_CHUNK_BYTES = 64 * 1024
+FFMPEG_STDERR_TAIL_BYTES = 64 * 1024
+SHORT_VIDEO_SECONDS = 120  # below this, overlay encodes use the "veryfast" x264 preset
+KEYFRAME_SEARCH_WINDOW = 20.0  # seconds past the overlay to look for a keyframe
+
+# encoder -> (hwaccel, hwaccel_output_format, overlay filter)
+HW_OVERLAY_KERNELS = {
+    "h264_nvenc": ("cuda", "cuda", "overlay_cuda"),
+    "h264_videotoolbox": ("videotoolbox", "videotoolbox_vld", "overlay_videotoolbox"),
+}
+
+
+class RemotionServerError(RuntimeError):
+    """The persistent render process failed, died or timed out."""
+
+
+class RemotionServer:
+    """
+    Long-lived `node render_server.js` process that renders transitions.
+
+    Jobs are sent as JSON lines on stdin and answered with one JSON line on
+    stdout. The process is started lazily and restarted on the next render
+    if it dies; a timed-out render kills it.
+    """
+
+    def __init__(self, video_effects_dir: Path):
+        self.video_effects_dir = video_effects_dir
+        self._proc = None
+        self._lock = threading.Lock()
+        self._job_ids = itertools.count(1)
+
+    def _read_reply(self, timeout: float) -> dict:
+        ready, _, _ = select.select([self._proc.stdout], [], [], timeout)
+        if not ready:
+            self.stop()
+            raise RemotionServerError(f"Render server did not respond within {timeout}s")
+        line = self._proc.stdout.readline()
+        if not line:
+            self.stop()
+            raise RemotionServerError("Render server exited unexpectedly")
+        try:
+            return json.loads(line)
+        except ValueError:
+            self.stop()
+            raise RemotionServerError(f"Malformed render server reply: {line.strip()[:200]!r}")
+
+    def _ensure_started(self) -> None:
+        if self._proc is not None and self._proc.poll() is None:
+            return
+        logger.info("Starting persistent Remotion render server")
+        self._proc = subprocess.Popen(
+            ["node", "render_server.js"],
+            cwd=str(self.video_effects_dir),
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            text=True,
+            bufsize=1,
+        )
+        if not self._read_reply(REMOTION_SERVER_STARTUP_TIMEOUT).get("ready"):
+            self.stop()
+            raise RemotionServerError("Render server failed to start")
+
+    def render(self, job: dict, timeout: float = REMOTION_SERVER_RENDER_TIMEOUT) -> None:
+        """Render one transition job; raises RemotionServerError on failure."""
+        with self._lock:
+            self._ensure_started()
+            job = {**job, "id": next(self._job_ids)}
+            try:
+                self._proc.stdin.write(json.dumps(job) + "\n")
+                self._proc.stdin.flush()
+            except (BrokenPipeError, OSError) as e:
+                self.stop()
+                raise RemotionServerError(f"Render server pipe closed: {e}")
+            reply = self._read_reply(timeout)
+            if not reply.get("ok"):
+                raise RemotionServerError(reply.get("error") or "Render failed")
+
+    def stop(self) -> None:
+        """Terminate the render process if it is running."""
+        proc, self._proc = self._proc, None
+        if proc is None or proc.poll() is not None:
+            return
+        proc.terminate()
+        try:
+            proc.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+
+
+_remotion_server = None
+_ffmpeg_filters = None
+_pan_3d_module = None
+
+
+def _get_remotion_server() -> RemotionServer | None:
+    """Return the shared render server, or None when it is disabled."""
+    global _remotion_server
+    if not REMOTION_RENDER_SERVER_ENABLED:
+        return None
+    if os.name == "nt":
+        # select() only works on sockets on Windows
+        logger.warning("REMOTION_RENDER_SERVER is not supported on Windows; using npx")
+        return None
+    if _remotion_server is None:
+        _remotion_server = RemotionServer(_VIDEO_EFFECTS_DIR)
+        atexit.register(_remotion_server.stop)
+    return _remotion_server
+
+
+_remotion_available_key = None
+
+
+def _remotion_install_key() -> tuple | None:
+    """Return mtimes identifying the current Remotion install, or None if missing."""
+    try:
+        return (
+            (_VIDEO_EFFECTS_DIR / "package.json").stat().st_mtime_ns,
+            (_VIDEO_EFFECTS_DIR / "node_modules").stat().st_mtime_ns,
+        )
+    except OSError:
+        return None
+
 
 def check_remotion_available() -> tuple[bool, str]:
     """
     Check if Remotion is available for rendering transitions.
     
+    A successful check is cached until package.json or node_modules in
+    video_effects change (e.g. after `npm install`), so the slow Node/npx probes
+    run once per install rather than once per video.
+    
     Returns:
         (available: bool, error_message: str)
     """
+    global _remotion_available_key
+
+    install_key = _remotion_install_key()
+    if install_key is not None and install_key == _remotion_available_key:
+        return True, ""
+
+    available, error_msg = _probe_remotion()
+    if available:
+        _remotion_available_key = install_key
+    return available, error_msg
+
+
+def _probe_remotion() -> tuple[bool, str]:
+    """Run the Node.js and Remotion CLI checks behind check_remotion_available()."""
     # Check Node.js
     try:
         result = subprocess.run(
@@ -40,38 +210,571 @@ def check_remotion_available() -> tuple[bool, str]:
         return False, "Node.js not found - required for Remotion rendering"
     
     # Check if video_effects directory exists with node_modules
-    project_root = Path(__file__).parent.parent.parent.parent
-    video_effects_dir = project_root / "Initial Templates - execution" / "video_effects"
+    if not _VIDEO_EFFECTS_DIR.exists():
+        return False, f"video_effects directory not found at {_VIDEO_EFFECTS_DIR}"
     
-    if not video_effects_dir.exists():
-        return False, f"video_effects directory not found at {video_effects_dir}"
-    
-    node_modules = video_effects_dir / "node_modules"
+    node_modules = _VIDEO_EFFECTS_DIR / "node_modules"
     if not node_modules.exists():
-        return False, f"Remotion dependencies not installed - run 'npm install' in {video_effects_dir}"
+        return False, f"Remotion dependencies not installed - run 'npm install' in {_VIDEO_EFFECTS_DIR}"
     
     # Check if @remotion/cli is installed
     remotion_cli = node_modules / "@remotion" / "cli"
     if not remotion_cli.exists():
-        return False, f"@remotion/cli not found - run 'npm install' in {video_effects_dir}"
+        return False, f"@remotion/cli not found - run 'npm install' in {_VIDEO_EFFECTS_DIR}"
     
     # Quick check if npx remotion works
     try:
         result = subprocess.run(
             ["npx", "remotion", "versions"],
-            cwd=str(video_effects_dir),
+            cwd=str(_VIDEO_EFFECTS_DIR),
             capture_output=True,
             text=True,
             timeout=10
         )
         if result.returncode != 0:
-            return False, f"Remotion CLI not working - try 'npm install' in {video_effects_dir}"
+            return False, f"Remotion CLI not working - try 'npm install' in {_VIDEO_EFFECTS_DIR}"
     except (subprocess.TimeoutExpired, FileNotFoundError) as e:
         return False, f"Remotion CLI check failed: {e}"
     
     return True, ""
 
 
+def _fast_passthrough(src: str, dst: str) -> None:
+    """
+    Make dst an unchanged copy of src without remuxing it.
+
+    Tries a hard link first (no bytes copied), then a plain file copy, and only
+    falls back to an FFmpeg stream copy if neither works.
+    """
+    if os.path.lexists(dst):
+        os.remove(dst)
+
+    try:
+        os.link(src, dst)
+        return
+    except OSError:
+        pass
+
+    try:
+        shutil.copyfile(src, dst)
+        return
+    except OSError:
+        pass
+
+    subprocess.run(
+        ["ffmpeg", "-y", "-i", src, "-c", "copy", dst],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        check=True,
+        timeout=60
+    )
+
+
+def _run_ffmpeg(cmd: list[str], timeout: float) -> subprocess.CompletedProcess:
+    """
+    Run an FFmpeg command, keeping only the tail of its stderr.
+
+    stderr is spooled to an anonymous temp file rather than a pipe, so long
+    encodes don't accumulate their progress log in memory; the last
+    FFMPEG_STDERR_TAIL_BYTES are returned as `stderr` for error reporting.
+    """
+    with tempfile.TemporaryFile() as err:
+        proc = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=err, timeout=timeout)
+        err.seek(0, os.SEEK_END)
+        err.seek(max(0, err.tell() - FFMPEG_STDERR_TAIL_BYTES))
+        tail = err.read().decode("utf-8", errors="replace")
+    return subprocess.CompletedProcess(cmd, proc.returncode, stderr=tail)
+
+
+def _get_encoder_args() -> list[str]:
+    """Return overlay encoder args (hardware if vad_processor detects it)."""
+    try:
+        from utils.vad_processor import get_cached_encoder_args
+        encoder_args = get_cached_encoder_args()
+        encoder_name = "unknown"
+        try:
+            idx = encoder_args.index("-c:v")
+            encoder_name = encoder_args[idx + 1]
+        except Exception:
+            pass
+        logger.info(f"Using video encoder: {encoder_name} ({' '.join(encoder_args)})")
+    except Exception:
+        # Fallback to software encoding
+        encoder_args = ["-c:v", "libx264", "-preset", "medium", "-crf", "23"]
+        logger.info(f"Using video encoder: libx264 ({' '.join(encoder_args)})")
+    return encoder_args
+
+
+def _load_pan_module():
+    """Load create_transition/get_video_info from pan_3d_transition.py (once)."""
+    global _pan_3d_module
+    if _pan_3d_module is None:
+        module_path = _EXECUTION_DIR / "pan_3d_transition.py"
+
+        if not module_path.exists():
+            raise FileNotFoundError(
+                f"pan_3d_transition.py not found at {module_path}"
+            )
+
+        spec = importlib.util.spec_from_file_location(
+            "pan_3d_transition",
+            module_path
+        )
+        if spec is None or spec.loader is None:
+            raise ImportError(f"Could not load spec for {module_path}")
+
+        pan_module = importlib.util.module_from_spec(spec)
+        sys.modules["pan_3d_transition"] = pan_module
+        spec.loader.exec_module(pan_module)
+        _pan_3d_module = pan_module
+
+    return _pan_3d_module.create_transition, _pan_3d_module.get_video_info
+
+
+def _transition_cache_path(input_path: str, duration: float, bg_image_path: str = None) -> Path | None:
+    """
+    Return where a rendered transition for these inputs is cached.
+
+    The transition samples frames from the whole video, so the key covers the
+    input's size plus TRANSITION_CACHE_SAMPLES evenly spaced chunks of its
+    bytes (a few MB of reads instead of a full-file hash), the duration, the
+    background image and pan_3d_transition.py itself (its effect defaults).
+    Returns None if the inputs can't be read.
+    """
+    try:
+        size = os.path.getsize(input_path)
+        effect_mtime = (_EXECUTION_DIR / "pan_3d_transition.py").stat().st_mtime_ns
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(f"{size}|{duration}|{effect_mtime}".encode())
+        with open(input_path, "rb") as f:
+            for n in range(TRANSITION_CACHE_SAMPLES):
+                f.seek(size * n // TRANSITION_CACHE_SAMPLES)
+                digest.update(f.read(TRANSITION_CACHE_CHUNK_BYTES))
+        if bg_image_path:
+            bg_stat = os.stat(bg_image_path)
+            digest.update(f"|{os.path.abspath(bg_image_path)}|{bg_stat.st_size}|{bg_stat.st_mtime_ns}".encode())
+    except OSError:
+        return None
+    return TRANSITION_CACHE_DIR / f"{digest.hexdigest()}.mp4"
+
+
+def _store_cached_transition(transition_path: str, cache_path: Path) -> None:
+    """Copy a rendered transition into the cache atomically and prune old entries."""
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        shutil.copyfile(transition_path, tmp_path)
+        os.replace(tmp_path, cache_path)
+
+        entries = sorted(cache_path.parent.glob("*.mp4"), key=lambda p: p.stat().st_mtime)
+        for stale in entries[:-TRANSITION_CACHE_MAX_FILES]:
+            stale.unlink(missing_ok=True)
+    except OSError as e:
+        logger.warning(f"Failed to cache transition: {e}")
+
+
+def _generate_transition(
+    create_transition,
+    input_path: str,
+    transition_path: str,
+    duration: float,
+    bg_image_path: str = None
+) -> float:
+    """
+    Produce the 3D transition for input_path in transition_path.
+
+    Reuses a cached render for identical inputs; otherwise renders it and
+    caches the result. Returns the transition's actual duration after
+    trimming/padding it to `duration`. Raises if rendering fails or times out.
+    """
+    cache_path = _transition_cache_path(input_path, duration, bg_image_path)
+    if cache_path is not None and cache_path.exists():
+        try:
+            _fast_passthrough(str(cache_path), transition_path)
+            cached_duration = get_duration(transition_path)
+            logger.info(f"Reusing cached transition: {cache_path}")
+            return cached_duration
+        except Exception as e:
+            logger.warning(f"Cached transition unusable, re-rendering: {e}")
+
+    actual_duration = _render_transition(
+        create_transition, input_path, transition_path, duration, bg_image_path
+    )
+    if cache_path is not None:
+        _store_cached_transition(transition_path, cache_path)
+    return actual_duration
+
+
+def _render_transition(
+    create_transition,
+    input_path: str,
+    transition_path: str,
+    duration: float,
+    bg_image_path: str = None
+) -> float:
+    """Render the transition with Remotion and correct its duration."""
+    # Timeouts are enforced by the subprocesses inside create_transition (and
+    # the render server's reply timeout), which raise TimeoutError; unlike
+    # SIGALRM this works off the main thread and on Windows.
+    transition_kwargs = dict(
+        input_path=input_path,
+        output_path=transition_path,
+        start=0,  # Start from beginning
+        output_duration=duration,
+        bg_image=bg_image_path,
+        sample_entire_video=True  # Sample frames evenly from entire video
+    )
+    renderer = _get_remotion_server()
+    try:
+        create_transition(**transition_kwargs, renderer=renderer)
+    except RemotionServerError as e:
+        logger.warning(f"Render server failed ({e}), retrying with npx remotion render")
+        create_transition(**transition_kwargs)
+
+    logger.info(f"3D transition generated: {transition_path}")
+
+    # Verify transition duration and fix if needed
+    try:
+        actual_duration = get_duration(transition_path)
+        duration_diff = abs(actual_duration - duration)
+
+        logger.info(f"Transition duration: expected={duration:.3f}s, actual={actual_duration:.3f}s, diff={duration_diff:.3f}s")
+
+        # If duration mismatch > 0.1s, trim or pad to exact duration
+        if duration_diff > 0.1:
+            logger.warning(f"Duration mismatch detected ({duration_diff:.3f}s), correcting...")
+
+            corrected_path = transition_path.replace(".mp4", "_corrected.mp4")
+
+            if actual_duration > duration:
+                # Trim to exact duration
+                logger.info(f"Trimming transition to {duration}s")
+                trim_cmd = [
+                    "ffmpeg", "-y",
+                    "-i", transition_path,
+                    "-t", str(duration),
+                    "-c:v", "copy",
+                    "-c:a", "copy",
+                    corrected_path
+                ]
+            else:
+                # Pad with last frame to exact duration
+                logger.info(f"Padding transition to {duration}s")
+                pad_duration = duration - actual_duration
+                trim_cmd = [
+                    "ffmpeg", "-y",
+                    "-i", transition_path,
+                    "-vf", f"tpad=stop_mode=clone:stop_duration={pad_duration}",
+                    "-c:a", "copy",
+                    corrected_path
+                ]
+
+            subprocess.run(
+                trim_cmd,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                check=True,
+                timeout=30
+            )
+
+            # Replace original with corrected
+            os.remove(transition_path)
+            os.rename(corrected_path, transition_path)
+
+            # Verify correction
+            actual_duration = get_duration(transition_path)
+            logger.info(f"Corrected transition duration: {actual_duration:.3f}s")
+
+        return actual_duration
+
+    except Exception as e:
+        logger.warning(f"Failed to verify/correct transition duration: {e}")
+        # Use expected duration as fallback
+        return duration
+
+
+def _overlay_cmd(
+    input_path: str,
+    transition_path: str,
+    output_path: str,
+    insert_at: float,
+    encoder_args: list[str]
+) -> list[str]:
+    """
+    Build the FFmpeg command that overlays the transition onto the video.
+
+    The transition is shifted to start at insert_at. Outside its timestamp
+    range the overlay has no frame to draw (before) or passes the main video
+    through (eof_action=pass, after), so no per-frame `enable` expression is
+    needed to limit it to [insert_at, insert_at + duration].
+    """
+    filter_complex = (
+        f"[1:v]setpts=PTS-STARTPTS+{insert_at}/TB[transition];"
+        f"[0:v][transition]overlay=eof_action=pass:x=0:y=0[v]"
+    )
+    return [
+        "ffmpeg", "-y",
+        "-i", input_path,           # [0] = original video
+        "-i", transition_path,       # [1] = transition video
+        "-filter_complex",
+        filter_complex,
+        "-map", "[v]",              # Use the overlaid video
+        "-map", "0:a",              # Use original audio
+        "-c:a", "copy",             # Copy audio without re-encoding
+    ] + encoder_args + [
+        output_path
+    ]
+
+
+def _available_filters() -> frozenset[str]:
+    """Names of the filters this FFmpeg build provides (probed once)."""
+    global _ffmpeg_filters
+    if _ffmpeg_filters is None:
+        try:
+            result = subprocess.run(
+                ["ffmpeg", "-hide_banner", "-filters"],
+                capture_output=True,
+                text=True,
+                timeout=5,
+            )
+            names = set()
+            for line in (result.stdout or "").splitlines():
+                parts = line.split()
+                # Filter rows look like " TSC overlay  VV->V  Overlay a video..."
+                if len(parts) >= 3 and "->" in parts[2]:
+                    names.add(parts[1])
+            _ffmpeg_filters = frozenset(names)
+        except Exception:
+            _ffmpeg_filters = frozenset()
+    return _ffmpeg_filters
+
+
+def _hw_overlay_cmd(
+    input_path: str,
+    transition_path: str,
+    output_path: str,
+    insert_at: float,
+    encoder_args: list[str]
+) -> list[str] | None:
+    """
+    Build a GPU-resident variant of _overlay_cmd, or None if unsupported.
+
+    Applies when the selected encoder has a matching hwaccel decoder and
+    overlay kernel, so frames stay on the device from decode to encode. The
+    hw overlay kernels don't all support timeline `enable`, so the window
+    comes from the shifted transition timestamps plus eof_action=pass.
+    """
+    try:
+        encoder = encoder_args[encoder_args.index("-c:v") + 1]
+    except (ValueError, IndexError):
+        return None
+    hw = HW_OVERLAY_KERNELS.get(encoder)
+    if hw is None:
+        return None
+    hwaccel, output_format, overlay_filter = hw
+    if overlay_filter not in _available_filters():
+        return None
+
+    hw_input = ["-hwaccel", hwaccel, "-hwaccel_output_format", output_format]
+    filter_complex = (
+        f"[1:v]setpts=PTS-STARTPTS+{insert_at}/TB[transition];"
+        f"[0:v][transition]{overlay_filter}=x=0:y=0:eof_action=pass[v]"
+    )
+    return [
+        "ffmpeg", "-y",
+        *hw_input, "-i", input_path,
+        *hw_input, "-i", transition_path,
+        "-filter_complex", filter_complex,
+        "-map", "[v]",
+        "-map", "0:a",
+        "-c:a", "copy",
+    ] + encoder_args + [
+        output_path
+    ]
+
+
+def _run_overlay(
+    input_path: str,
+    transition_path: str,
+    output_path: str,
+    insert_at: float,
+    encoder_args: list[str]
+) -> subprocess.CompletedProcess:
+    """Run the full-length overlay, on the GPU when possible, else on the CPU."""
+    hw_cmd = _hw_overlay_cmd(input_path, transition_path, output_path, insert_at, encoder_args)
+    if hw_cmd is not None:
+        result = _run_ffmpeg(hw_cmd, timeout=300)
+        if result.returncode == 0:
+            logger.info("Overlay ran on the hardware filter path")
+            return result
+        logger.warning(f"Hardware overlay failed, retrying on CPU: {result.stderr[-500:]}")
+
+    return _run_ffmpeg(
+        _overlay_cmd(input_path, transition_path, output_path, insert_at, encoder_args),
+        timeout=300  # 5 minute timeout
+    )
+
+
+def _keyframe_bounds(input_path: str, start: float, end: float) -> tuple[float, float] | None:
+    """
+    Return (last keyframe <= start, first keyframe >= end) for the video stream.
+
+    Only packet headers up to `end + KEYFRAME_SEARCH_WINDOW` are read. Returns
+    None if no keyframe follows `end` in that window.
+    """
+    packets = subprocess.run(
+        [
+            "ffprobe", "-v", "error",
+            "-select_streams", "v:0",
+            "-read_intervals", f"%{end + KEYFRAME_SEARCH_WINDOW}",
+            "-show_entries", "packet=pts_time,flags",
+            "-of", "csv=p=0",
+            input_path
+        ],
+        capture_output=True,
+        text=True,
+        timeout=60
+    )
+    if packets.returncode != 0:
+        return None
+
+    keyframes = []
+    for line in packets.stdout.splitlines():
+        pts_time, _, flags = line.partition(",")
+        if "K" in flags:
+            try:
+                keyframes.append(float(pts_time))
+            except ValueError:
+                continue
+    keyframes.sort()
+
+    before = [k for k in keyframes if k <= start]
+    after = [k for k in keyframes if k >= end]
+    if not before or not after:
+        return None
+    return before[-1], after[0]
+
+
+def _overlay_segmented(
+    input_path: str,
+    transition_path: str,
+    output_path: str,
+    insert_at: float,
+    overlay_end: float
+) -> bool:
+    """
+    Overlay the transition re-encoding only the GOPs it touches.
+
+    The video is split at the keyframes around [insert_at, overlay_end]: the
+    outer spans are stream-copied, the middle span is overlaid and encoded
+    with libx264 matched to the source stream, and the pieces are joined as
+    MPEG-TS (in-band SPS/PPS) before the original audio is muxed back in.
+    Only used when SMART_CUT is enabled. Returns False, leaving output_path
+    untouched, when the input isn't suitable or any step fails; callers then
+    fall back to a full re-encode.
+    """
+    try:
+        # Pieces are joined as MPEG-TS, so only H.264 sources qualify
+        stream = probe_video_stream(input_path)
+        if not stream or stream.get("codec_name") != "h264":
+            return False
+        encoder_args = matched_encoder_args(stream)
+        if encoder_args is None:
+            return False
+        bounds = _keyframe_bounds(input_path, insert_at, overlay_end)
+    except (subprocess.TimeoutExpired, OSError) as e:
+        logger.info(f"Segmented overlay unavailable ({e}), re-encoding whole video")
+        return False
+    if bounds is None:
+        return False
+    seg_start, seg_end = bounds
+
+    to_annexb = ["-bsf:v", "h264_mp4toannexb", "-f", "mpegts"]
+    with tempfile.TemporaryDirectory() as tmpdir:
+        pieces = []
+        cmds = []
+
+        if seg_start > 0:
+            pre_path = os.path.join(tmpdir, "pre.ts")
+            cmds.append([
+                "ffmpeg", "-y", "-i", input_path,
+                "-map", "0:v:0", "-c", "copy", "-t", str(seg_start),
+            ] + to_annexb + [pre_path])
+            pieces.append(pre_path)
+
+        mid_path = os.path.join(tmpdir, "mid.ts")
+        local_start = insert_at - seg_start
+        filter_complex = (
+            f"[1:v]setpts=PTS-STARTPTS+{local_start}/TB[transition];"
+            f"[0:v][transition]overlay=eof_action=pass:x=0:y=0[v]"
+        )
+        cmds.append([
+            "ffmpeg", "-y",
+            "-ss", str(seg_start), "-t", str(seg_end - seg_start), "-i", input_path,
+            "-i", transition_path,
+            "-filter_complex", filter_complex,
+            "-map", "[v]",
+        ] + encoder_args + to_annexb + [mid_path])
+        pieces.append(mid_path)
+
+        post_path = os.path.join(tmpdir, "post.ts")
+        # Nudge past the keyframe so the copy seek can't land on the previous GOP
+        cmds.append([
+            "ffmpeg", "-y", "-ss", str(seg_end + 0.001), "-i", input_path,
+            "-map", "0:v:0", "-c", "copy",
+        ] + to_annexb + [post_path])
+        pieces.append(post_path)
+
+        list_path = os.path.join(tmpdir, "concat.txt")
+        with open(list_path, "w") as f:
+            for piece in pieces:
+                f.write(f"file '{piece}'\n")
+
+        final_cmd = [
+            "ffmpeg", "-y",
+            "-f", "concat", "-safe", "0", "-i", list_path,
+            "-i", input_path,
+            "-map", "0:v", "-map", "1:a",
+            "-c", "copy",
+        ]
+        # Keep the source timescale so copied packet timestamps stay exact
+        time_base = stream.get("time_base", "")
+        if time_base.startswith("1/"):
+            final_cmd += ["-video_track_timescale", time_base[2:]]
+        cmds.append(final_cmd + ["-movflags", "+faststart", output_path])
+
+        for cmd in cmds:
+            result = _run_ffmpeg(cmd, timeout=300)
+            if result.returncode != 0:
+                logger.warning(f"Segmented overlay failed, re-encoding whole video: {result.stderr[-500:]}")
+                if os.path.exists(output_path):
+                    os.remove(output_path)
+                return False
+
+    logger.info(
+        f"Segmented overlay: re-encoded {seg_end - seg_start:.2f}s "
+        f"({seg_start:.2f}s-{seg_end:.2f}s), stream-copied the rest"
+    )
+    return True
+
+
+def _scale_preset_to_duration(encoder_args: list[str], video_duration: float) -> list[str]:
+    """
+    Use a faster libx264 preset for short videos.
+
+    On short clips the encode is dominated by the overlay window, where
+    "veryfast" is visually indistinguishable at the same CRF; longer videos
+    keep the configured preset. Non-x264 encoders are returned unchanged.
+    """
+    if "libx264" not in encoder_args or "-preset" not in encoder_args:
+        return encoder_args
+    if video_duration >= SHORT_VIDEO_SECONDS:
+        return encoder_args
+    args = list(encoder_args)
+    args[args.index("-preset") + 1] = "veryfast"
+    return args
+
+
 def add_intro_transition(
     input_path: str,
     output_path: str,
@@ -107,11 +810,7 @@ def add_intro_transition(
         logger.warning("Falling back to copying video without transition")
         
         try:
-            subprocess.run(
-                ["ffmpeg", "-y", "-i", input_path, "-c", "copy", output_path],
-                capture_output=True,
-                check=True
-            )
+            _fast_passthrough(input_path, output_path)
             return {
                 "success": True,
                 "transition_applied": False,
@@ -123,39 +822,13 @@ def add_intro_transition(
     
     # Import pan_3d_transition module
     try:
-        project_root = Path(__file__).parent.parent.parent.parent
-        execution_dir = project_root / "Initial Templates - execution"
-        module_path = execution_dir / "pan_3d_transition.py"
-
-        if not module_path.exists():
-            raise FileNotFoundError(
-                f"pan_3d_transition.py not found at {module_path}"
-            )
-
-        spec = importlib.util.spec_from_file_location(
-            "pan_3d_transition",
-            module_path
-        )
-        if spec is None or spec.loader is None:
-            raise ImportError(f"Could not load spec for {module_path}")
-
-        pan_module = importlib.util.module_from_spec(spec)
-        sys.modules["pan_3d_transition"] = pan_module
-        spec.loader.exec_module(pan_module)
-
-        create_transition = pan_module.create_transition
-        get_video_info = pan_module.get_video_info
-
+        create_transition, get_video_info = _load_pan_module()
     except Exception as e:
         logger.error(f"Failed to import pan_3d_transition: {e}")
         logger.warning("Falling back to copying video")
         
         try:
-            subprocess.run(
-                ["ffmpeg", "-y", "-i", input_path, "-c", "copy", output_path],
-                capture_output=True,
-                check=True
-            )
+            _fast_passthrough(input_path, output_path)
             return {
                 "success": True,
                 "transition_applied": False,
@@ -178,92 +851,18 @@ def add_intro_transition(
     with tempfile.NamedTemporaryFile(suffix=".mp4", delete=False) as transition_file:
         transition_path = transition_file.name
     
+    # Probe the overlay encoder while Remotion renders; the result is cached
+    # in vad_processor, so the overlay step below picks it up for free.
+    encoder_thread = threading.Thread(target=_get_encoder_args, daemon=True)
+    encoder_thread.start()
+
     try:
         logger.info(f"Generating 3D transition (teaser from {teaser_start}s)")
         logger.info("This may take 30-60 seconds...")
         
-        # Set timeout for transition generation (2 minutes max)
-        import signal
-        
-        def timeout_handler(signum, frame):
-            raise TimeoutError("Transition generation timed out after 2 minutes")
-        
-        # Only use signal timeout on Unix systems
-        if hasattr(signal, 'SIGALRM'):
-            old_handler = signal.signal(signal.SIGALRM, timeout_handler)
-            signal.alarm(120)  # 2 minute timeout
-        
-        try:
-            create_transition(
-                input_path=input_path,
-                output_path=transition_path,
-                start=0,  # Start from beginning
-                output_duration=duration,
-                bg_image=bg_image_path,
-                sample_entire_video=True  # Sample frames evenly from entire video
-            )
-        finally:
-            if hasattr(signal, 'SIGALRM'):
-                signal.alarm(0)  # Cancel alarm
-                signal.signal(signal.SIGALRM, old_handler)
-        
-        logger.info(f"3D transition generated: {transition_path}")
-        
-        # Verify transition duration and fix if needed
-        try:
-            actual_transition_info = get_video_info(transition_path)
-            actual_duration = actual_transition_info["duration"]
-            duration_diff = abs(actual_duration - duration)
-            
-            logger.info(f"Transition duration: expected={duration:.3f}s, actual={actual_duration:.3f}s, diff={duration_diff:.3f}s")
-            
-            # If duration mismatch > 0.1s, trim or pad to exact duration
-            if duration_diff > 0.1:
-                logger.warning(f"Duration mismatch detected ({duration_diff:.3f}s), correcting...")
-                
-                corrected_path = transition_path.replace(".mp4", "_corrected.mp4")
-                
-                if actual_duration > duration:
-                    # Trim to exact duration
-                    logger.info(f"Trimming transition to {duration}s")
-                    trim_cmd = [
-                        "ffmpeg", "-y",
-                        "-i", transition_path,
-                        "-t", str(duration),
-                        "-c:v", "copy",
-                        "-c:a", "copy",
-                        corrected_path
-                    ]
-                else:
-                    # Pad with last frame to exact duration
-                    logger.info(f"Padding transition to {duration}s")
-                    pad_duration = duration - actual_duration
-                    trim_cmd = [
-                        "ffmpeg", "-y",
-                        "-i", transition_path,
-                        "-vf", f"tpad=stop_mode=clone:stop_duration={pad_duration}",
-                        "-c:a", "copy",
-                        corrected_path
-                    ]
-                
-                subprocess.run(trim_cmd, capture_output=True, check=True, timeout=30)
-                
-                # Replace original with corrected
-                os.remove(transition_path)
-                os.rename(corrected_path, transition_path)
-                
-                # Verify correction
-                corrected_info = get_video_info(transition_path)
-                actual_duration = corrected_info["duration"]
-                logger.info(f"Corrected transition duration: {actual_duration:.3f}s")
-            
-            # Use actual duration for overlay (will be used later)
-            transition_actual_duration = actual_duration
-            
-        except Exception as e:
-            logger.warning(f"Failed to verify/correct transition duration: {e}")
-            # Use expected duration as fallback
-            transition_actual_duration = duration
+        transition_actual_duration = _generate_transition(
+            create_transition, input_path, transition_path, duration, bg_image_path
+        )
         
     except TimeoutError as e:
         logger.error(f"Transition generation timed out: {e}")
@@ -273,12 +872,7 @@ def add_intro_transition(
         
         # Fallback: copy video
         try:
-            subprocess.run(
-                ["ffmpeg", "-y", "-i", input_path, "-c", "copy", output_path],
-                capture_output=True,
-                check=True,
-                timeout=60
-            )
+            _fast_passthrough(input_path, output_path)
             return {
                 "success": True,
                 "transition_applied": False,
@@ -294,12 +888,7 @@ def add_intro_transition(
         
         # Fallback: copy video
         try:
-            subprocess.run(
-                ["ffmpeg", "-y", "-i", input_path, "-c", "copy", output_path],
-                capture_output=True,
-                check=True,
-                timeout=60
-            )
+            _fast_passthrough(input_path, output_path)
             return {
                 "success": True,
                 "transition_applied": False,
@@ -316,57 +905,18 @@ def add_intro_transition(
         overlay_end = insert_at + transition_actual_duration
         logger.info(f"Overlay duration: {transition_actual_duration:.3f}s (from {insert_at}s to {overlay_end:.3f}s)")
         
-        # Try to get hardware encoder args (from vad_processor if available)
-        encoder_args = []
-        try:
-            # Import hardware encoder detection
-            sys.path.insert(0, str(Path(__file__).parent))
-            try:
-                from vad_processor import get_cached_encoder_args
-                encoder_args = get_cached_encoder_args()
-                encoder_name = "unknown"
-                try:
-                    idx = encoder_args.index("-c:v")
-                    encoder_name = encoder_args[idx + 1]
-                except Exception:
-                    pass
-                logger.info(f"Using video encoder: {encoder_name} ({' '.join(encoder_args)})")
-            finally:
-                sys.path.pop(0)
-        except Exception:
-            # Fallback to software encoding
-            encoder_args = ["-c:v", "libx264", "-preset", "medium", "-crf", "23"]
-            logger.info(f"Using video encoder: libx264 ({' '.join(encoder_args)})")
-        
-        # Build FFmpeg command
-        filter_complex = (
-            f"[1:v]setpts=PTS-STARTPTS+{insert_at}/TB[transition];"
-            f"[0:v][transition]overlay=enable='between(t,{insert_at},{overlay_end})'"
-            f":eof_action=pass:x=0:y=0[v]"
-        )
-        cmd = [
-            "ffmpeg", "-y",
-            "-i", input_path,           # [0] = original video
-            "-i", transition_path,       # [1] = transition video
-            "-filter_complex",
-            filter_complex,
-            "-map", "[v]",              # Use the overlaid video
-            "-map", "0:a",              # Use original audio
-            "-c:a", "copy",             # Copy audio without re-encoding
-        ] + encoder_args + [
-            output_path
-        ]
+        encoder_thread.join()
+        encoder_args = _scale_preset_to_duration(_get_encoder_args(), video_duration)
         
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=300  # 5 minute timeout
-        )
-        
-        if result.returncode != 0:
-            logger.error(f"FFmpeg overlay failed: {result.stderr}")
-            raise RuntimeError(f"FFmpeg overlay failed: {result.stderr}")
+        if not (
+            SMART_CUT_ENABLED
+            and _overlay_segmented(input_path, transition_path, output_path, insert_at, overlay_end)
+        ):
+            result = _run_overlay(input_path, transition_path, output_path, insert_at, encoder_args)
+            
+            if result.returncode != 0:
+                logger.error(f"FFmpeg overlay failed: {result.stderr}")
+                raise RuntimeError(f"FFmpeg overlay failed: {result.stderr}")
         
         logger.info(f"Transition overlay complete: {output_path}")
         
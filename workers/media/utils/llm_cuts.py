@@ -19,14 +19,53 @@ Architecture:
 4. Parse enhanced response with confidence scores
 5. Apply cuts via FFmpeg or fallback to heuristics
 """
+import bisect
+import functools
+import hashlib
+import itertools
 import logging
 import json
-import re
+import os
+import random
+import string
+import threading
 import time
-import requests
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+import httpx
+import numpy as np
 from typing import List, Dict, Optional, Tuple
 from openai import OpenAI
 
+try:
+    import tiktoken
+except ImportError:  # tiktoken is optional; token counts fall back to a char estimate
+    tiktoken = None
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; its decode errors subclass json.JSONDecodeError
+    orjson = None
+
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+
+def _json_dumps(obj) -> bytes:
+    """Serialize a request body to compact UTF-8 JSON, with orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+try:
+    import h2  # noqa: F401  (enables HTTP/2 in httpx)
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
+
+_http_client = None
+_http_client_lock = threading.Lock()
+
 logger = logging.getLogger(__name__)
 
 # Default configuration
@@ -34,8 +73,28 @@ DEFAULT_CONTEXT_WINDOW_SECONDS = 30
 DEFAULT_MIN_CONFIDENCE = 0.7
 DEFAULT_MAX_RETRIES = 3
 DEFAULT_RETRY_DELAY = 2.0
+RETRY_AFTER_MAX_SECONDS = 30.0  # cap on a server-requested Retry-After wait
+LLM_MAX_CONCURRENCY = 8  # parallel cluster requests, to stay within rate limits
+# The answer is a ~60 token JSON object. Responses API models spend part of
+# their budget on reasoning, so only the chat path is capped tightly.
+RESPONSES_MAX_OUTPUT_TOKENS = 1200
+CHAT_MAX_TOKENS = 300
+LLM_TEMPERATURE = 0.2
+BATCH_POLL_INTERVAL_SECONDS = 15
+# How long analyze_retake_cuts blocks waiting on a batch before giving up and
+# calling per cluster; the job holds its worker for this whole time
+BATCH_POLL_TIMEOUT_SECONDS = int(os.getenv("LLM_BATCH_POLL_TIMEOUT_SECONDS", "1800"))
+LLM_SYSTEM_PROMPT = (
+    "You are an expert video editing assistant. "
+    "Return JSON only with a precise mistake_start_time."
+)
+LLM_CACHE_DIR = Path(os.getenv("WORKER_TEMP_DIR") or os.getenv("TEMP_DIR") or "/tmp/yt-worker") / "llm_cache"
+LLM_CACHE_MAX_FILES = 512
 RETAKE_CLUSTER_MAX_GAP_SECONDS = 20.0
+CUT_MERGE_GAP_SECONDS = 0.5
 POST_MARKER_CONTEXT_SECONDS = 12.0
+MAX_EXCERPT_TOKENS = 4000
+CHARS_PER_TOKEN_ESTIMATE = 4
 PATTERN_MIN_LOOKBACK_SECONDS = {
     "quick_fix": 0.5,
     "medium_segment": 1.5,
@@ -43,6 +102,62 @@ PATTERN_MIN_LOOKBACK_SECONDS = {
     "multiple_attempts": 2.0,
     "unknown": 0.5,
 }
+SENTENCE_END_CHARS = frozenset(".!?")
+RETAKE_TOKENS = frozenset({"cut", "retake", "oops"})
+RETAKE_TOKEN_STRIP_CHARS = ".,!?"
+
+# Static instructions and the answer format come first and the per-cluster
+# values last, so every request shares the longest possible byte-identical
+# prefix (OpenAI prompt caching matches on prefixes).
+CLUSTER_PROMPT_TEMPLATE = string.Template("""You are analyzing a SINGLE cluster of retake markers in a video transcript.
+
+The speaker says retake phrases (like "cut cut") to redo a section. If there are multiple markers in the cluster,
+they represent failed attempts leading up to a final successful take AFTER the last marker.
+
+Your task: choose ONE mistake_start_time so we can remove the entire failed section:
+remove from mistake_start_time → last_marker_end.
+
+Constraints:
+- mistake_start_time MUST be before the first marker start.
+- Prefer sentence boundaries or natural pauses.
+- Keep the last completed thought before the mistake.
+- Do NOT remove content after the last marker end (that is the successful take).
+
+Return JSON only:
+{
+  "mistake_start_time": <float>,
+  "reason": "<short reason>",
+  "confidence": <0-1>
+}
+
+Transcript excerpt (timestamps):
+$cluster_excerpt
+
+Markers in this cluster:
+$cluster_markers
+
+First marker start: ${first_marker_start}s
+Last marker end: ${last_marker_end}s
+""")
+
+# Structured output for gpt-5 (Responses API): the answer is validated
+# server-side, so parse failures no longer cost a retry with backoff. The chat
+# path keeps plain JSON mode, which older models also accept.
+CLUSTER_ANSWER_FORMAT = {
+    "type": "json_schema",
+    "name": "retake_cluster_cut",
+    "strict": True,
+    "schema": {
+        "type": "object",
+        "properties": {
+            "mistake_start_time": {"type": "number"},
+            "reason": {"type": "string"},
+            "confidence": {"type": "number"},
+        },
+        "required": ["mistake_start_time", "reason", "confidence"],
+        "additionalProperties": False,
+    },
+}
 
 MODEL_ALIASES = {
     "gpt-4": "gpt-5.2",
@@ -60,7 +175,8 @@ def normalize_llm_model(model: str) -> str:
 def extract_context_window(
     transcript_words: List[Dict],
     marker_time: float,
-    window_seconds: float = DEFAULT_CONTEXT_WINDOW_SECONDS
+    window_seconds: float = DEFAULT_CONTEXT_WINDOW_SECONDS,
+    word_starts: Optional[List[float]] = None
 ) -> Tuple[List[Dict], int, int]:
     """
     Extract a context window of transcript around a retake marker.
@@ -69,6 +185,8 @@ def extract_context_window(
         transcript_words: Full transcript with word-level timestamps
         marker_time: Time of the retake marker (seconds)
         window_seconds: Size of context window before/after marker (default: 30s)
+        word_starts: Precomputed word start times; pass when extracting several
+            windows from the same transcript to avoid rebuilding them
     
     Returns:
         Tuple of (context_words, start_index, end_index)
@@ -82,18 +200,16 @@ def extract_context_window(
     start_time = max(0, marker_time - window_seconds)
     end_time = marker_time + window_seconds
     
-    context_words = []
-    start_index = -1
-    end_index = -1
+    # Word starts are monotonic, so the window is a contiguous slice
+    if word_starts is None:
+        word_starts = [w["start"] for w in transcript_words]
+    start_index = bisect.bisect_left(word_starts, start_time)
+    end_index = bisect.bisect_right(word_starts, end_time) - 1
     
-    for i, word in enumerate(transcript_words):
-        if start_time <= word["start"] <= end_time:
-            if start_index == -1:
-                start_index = i
-            context_words.append(word)
-            end_index = i
+    if start_index > end_index:
+        return [], -1, -1
     
-    return context_words, start_index, end_index
+    return transcript_words[start_index:end_index + 1], start_index, end_index
 
 
 def identify_sentence_boundaries(
@@ -110,33 +226,58 @@ def identify_sentence_boundaries(
     Returns:
         List of word indices that mark sentence boundaries
     """
-    boundaries = []
+    n = len(transcript_words)
+    if n == 0:
+        return []
     
-    for i in range(len(transcript_words) - 1):
-        word = transcript_words[i]["word"].strip()
-        
-        # Check for sentence-ending punctuation
-        has_punctuation = bool(re.search(r'[.!?]$', word))
-        
-        # Check for pause between this word and next
-        pause_duration = transcript_words[i + 1]["start"] - transcript_words[i]["end"]
-        has_pause = pause_duration >= min_pause_seconds
-        
-        if has_punctuation or has_pause:
-            boundaries.append(i)
+    starts = np.fromiter((w["start"] for w in transcript_words), dtype=np.float64, count=n)
+    ends = np.fromiter((w["end"] for w in transcript_words), dtype=np.float64, count=n)
+    
+    # Sentence-ending punctuation on every word but the last
+    has_punctuation = np.fromiter(
+        (w["word"].rstrip()[-1:] in SENTENCE_END_CHARS for w in transcript_words[:-1]),
+        dtype=bool,
+        count=n - 1
+    )
+    
+    # Pause between each word and the next
+    has_pause = (starts[1:] - ends[:-1]) >= min_pause_seconds
+    
+    boundaries = np.flatnonzero(has_punctuation | has_pause).tolist()
     
     # Always include the last word as a boundary
-    if transcript_words:
-        boundaries.append(len(transcript_words) - 1)
+    boundaries.append(n - 1)
     
     return boundaries
 
 
+def _marker_start_times(
+    transcript_words: List[Dict],
+    retake_matches: Optional[List[Dict]] = None
+) -> List[float]:
+    """Sorted start times of retake markers, from matches or transcript tokens."""
+    if retake_matches:
+        return sorted(m["start"] for m in retake_matches)
+    return sorted(
+        w["start"] for w in transcript_words
+        if w.get("word", "").lower().strip(RETAKE_TOKEN_STRIP_CHARS) in RETAKE_TOKENS
+    )
+
+
+def _count_nearby_markers(marker_starts: List[float], time: float, window: float) -> int:
+    """Count markers strictly within +/- window of time, excluding time itself."""
+    lo = bisect.bisect_right(marker_starts, time - window)
+    hi = bisect.bisect_left(marker_starts, time + window)
+    same = bisect.bisect_right(marker_starts, time) - bisect.bisect_left(marker_starts, time)
+    return hi - lo - same
+
+
 def detect_retake_pattern(
     context_words: List[Dict],
     retake_match: Dict,
     transcript_words: List[Dict],
-    retake_matches: Optional[List[Dict]] = None
+    retake_matches: Optional[List[Dict]] = None,
+    marker_starts: Optional[List[float]] = None
 ) -> str:
     """
     Classify the type of retake pattern based on context analysis.
@@ -150,20 +291,25 @@ def detect_retake_pattern(
         context_words: Context window around the retake marker
         retake_match: The retake marker match info
         transcript_words: Full transcript for pattern detection
+        retake_matches: Optional known retake markers (preferred over
+            scanning the transcript for marker tokens)
+        marker_starts: Optional pre-sorted marker start times; pass this
+            when classifying many markers so it is only built once
     
     Returns:
         Pattern type string
     """
     retake_time = retake_match["start"]
     
-    # Find words before the retake marker
-    before_words = [w for w in context_words if w["end"] < retake_time]
+    # Find the first word before the retake marker
+    first_word_time = next(
+        (w["start"] for w in context_words if w["end"] < retake_time), None
+    )
     
-    if not before_words:
+    if first_word_time is None:
         return "unknown"
     
     # Calculate duration of content before retake
-    first_word_time = before_words[0]["start"]
     duration_before = retake_time - first_word_time
     
     # Quick fix: short duration before retake
@@ -171,23 +317,14 @@ def detect_retake_pattern(
         return "quick_fix"
     
     # Check for multiple retake markers nearby
-    if retake_matches:
-        nearby_markers = [
-            m for m in retake_matches
-            if abs(m["start"] - retake_time) < RETAKE_CLUSTER_MAX_GAP_SECONDS
-            and m["start"] != retake_time
-        ]
-        if nearby_markers:
-            return "multiple_attempts"
-    else:
-        nearby_markers = [
-            w for w in transcript_words
-            if w.get("word", "").lower().strip(".,!?") in ["cut", "retake", "oops"]
-            and abs(w["start"] - retake_time) < 20.0
-            and w["start"] != retake_time
-        ]
-        if len(nearby_markers) >= 2:
-            return "multiple_attempts"
+    if marker_starts is None:
+        marker_starts = _marker_start_times(transcript_words, retake_matches)
+    nearby_count = _count_nearby_markers(
+        marker_starts, retake_time, RETAKE_CLUSTER_MAX_GAP_SECONDS
+    )
+    # Known markers: any neighbour counts; token scan needs two to be sure
+    if nearby_count >= (1 if retake_matches else 2):
+        return "multiple_attempts"
     
     # Full redo: longer duration before retake
     if duration_before >= 10.0:
@@ -196,6 +333,27 @@ def detect_retake_pattern(
     return "medium_segment"
 
 
+class _BoundaryIndex:
+    """
+    Sorted sentence-boundary times for O(log B) nearest-boundary lookups.
+    """
+
+    def __init__(self, transcript_words: List[Dict], boundaries: List[int]):
+        valid = [i for i in boundaries if i < len(transcript_words)]
+        self.end_times = [transcript_words[i]["end"] for i in valid]
+        self.start_times = [transcript_words[i]["start"] for i in valid]
+
+    def nearest_before(self, target_time: float) -> Optional[float]:
+        """Return the latest boundary end time <= target_time."""
+        idx = bisect.bisect_right(self.end_times, target_time) - 1
+        return self.end_times[idx] if idx >= 0 else None
+
+    def nearest_after(self, target_time: float) -> Optional[float]:
+        """Return the earliest boundary start time >= target_time."""
+        idx = bisect.bisect_left(self.start_times, target_time)
+        return self.start_times[idx] if idx < len(self.start_times) else None
+
+
 def find_nearest_sentence_boundary(
     transcript_words: List[Dict],
     target_time: float,
@@ -217,18 +375,10 @@ def find_nearest_sentence_boundary(
     if not boundaries or not transcript_words:
         return None
     
+    index = _BoundaryIndex(transcript_words, boundaries)
     if search_direction == "before":
-        # Find latest boundary before target time
-        for i in reversed(boundaries):
-            if i < len(transcript_words) and transcript_words[i]["end"] <= target_time:
-                return transcript_words[i]["end"]
-    else:  # after
-        # Find earliest boundary after target time
-        for i in boundaries:
-            if i < len(transcript_words) and transcript_words[i]["start"] >= target_time:
-                return transcript_words[i]["start"]
-    
-    return None
+        return index.nearest_before(target_time)
+    return index.nearest_after(target_time)
 
 
 def cluster_retake_markers(
@@ -258,57 +408,121 @@ def cluster_retake_markers(
 def build_transcript_excerpt(
     transcript_words: List[Dict],
     start_time: float,
-    end_time: float
+    end_time: float,
+    max_tokens: Optional[int] = None,
+    focus_range: Optional[Tuple[float, float]] = None,
+    model: str = "gpt-5.2",
+    word_starts: Optional[List[float]] = None
 ) -> str:
     """
     Build a timestamped transcript excerpt within the given time window.
+
+    When max_tokens is set, words furthest from focus_range (default: the whole
+    window) are dropped from the edges until the excerpt fits the budget.
+    Pass word_starts (as for extract_context_window) when building several
+    excerpts from the same transcript.
     """
+    # Word starts are monotonic, so the window is a contiguous slice
+    if word_starts is None:
+        word_starts = [w["start"] for w in transcript_words]
+    excerpt_words = transcript_words[
+        bisect.bisect_left(word_starts, start_time):bisect.bisect_right(word_starts, end_time)
+    ]
     excerpt_lines = [
         f"[{w['start']:.2f}s - {w['end']:.2f}s] {w['word']}"
-        for w in transcript_words
-        if start_time <= w["start"] <= end_time
+        for w in excerpt_words
     ]
-    return "\n".join(excerpt_lines)
+    excerpt = "\n".join(excerpt_lines)
+
+    # Every token spans at least one character, so short excerpts always fit
+    if max_tokens is None or len(excerpt) <= max_tokens:
+        return excerpt
+
+    focus_start, focus_end = focus_range or (start_time, end_time)
+    line_tokens = [_count_tokens(line, model) + 1 for line in excerpt_lines]
+    total_tokens = sum(line_tokens)
+    lo, hi = 0, len(excerpt_lines)
+
+    while total_tokens > max_tokens and hi - lo > 1:
+        lead_distance = focus_start - excerpt_words[lo]["start"]
+        tail_distance = excerpt_words[hi - 1]["start"] - focus_end
+        if lead_distance <= 0 and tail_distance <= 0:
+            break
+        if lead_distance >= tail_distance:
+            total_tokens -= line_tokens[lo]
+            lo += 1
+        else:
+            hi -= 1
+            total_tokens -= line_tokens[hi]
+
+    if hi - lo < len(excerpt_lines):
+        logger.info(
+            f"  Trimmed transcript excerpt from {len(excerpt_lines)} to {hi - lo} words "
+            f"(~{total_tokens} tokens, budget {max_tokens})"
+        )
+    return "\n".join(excerpt_lines[lo:hi])
+
+
+@functools.lru_cache(maxsize=8)
+def _get_token_encoding(model: str):
+    """
+    Return the tiktoken encoding for model (o200k_base for unknown models).
+
+    Returns None if the encoding can't be loaded; tiktoken downloads BPE files
+    on first use, so this can fail offline. The result is cached either way.
+    """
+    try:
+        try:
+            return tiktoken.encoding_for_model(model)
+        except KeyError:
+            return tiktoken.get_encoding("o200k_base")
+    except Exception as e:
+        logger.warning(f"Could not load tiktoken encoding for {model}, estimating tokens: {e}")
+        return None
+
+
+def _count_tokens(text: str, model: str) -> int:
+    """Count prompt tokens with tiktoken, or estimate from length if unavailable."""
+    encoding = _get_token_encoding(model) if tiktoken is not None else None
+    if encoding is None:
+        return len(text) // CHARS_PER_TOKEN_ESTIMATE + 1
+    return len(encoding.encode(text))
 
 
 def _use_responses_api(model: str) -> bool:
     return model.startswith("gpt-5")
 
 
-def _call_responses_api(
-    model: str,
-    api_key: str,
-    prompt: str,
-    temperature: float,
-    max_output_tokens: int
-) -> str:
-    url = "https://api.openai.com/v1/responses"
-    payload = {
+def _responses_payload(model: str, prompt: str, temperature: float, max_output_tokens: int) -> Dict:
+    return {
         "model": model,
         "input": [
             {
                 "role": "system",
-                "content": (
-                    "You are an expert video editing assistant. "
-                    "Return JSON only with a precise mistake_start_time."
-                ),
+                "content": LLM_SYSTEM_PROMPT,
             },
             {"role": "user", "content": prompt},
         ],
         "temperature": temperature,
         "max_output_tokens": max_output_tokens,
-        "text": {"format": {"type": "json_object"}},
+        "text": {"format": CLUSTER_ANSWER_FORMAT},
     }
-    headers = {
-        "Authorization": f"Bearer {api_key}",
-        "Content-Type": "application/json",
+
+
+def _chat_payload(model: str, prompt: str, temperature: float, max_tokens: int) -> Dict:
+    return {
+        "model": model,
+        "messages": [
+            {"role": "system", "content": LLM_SYSTEM_PROMPT},
+            {"role": "user", "content": prompt}
+        ],
+        "temperature": temperature,
+        "max_tokens": max_tokens,
+        "response_format": {"type": "json_object"},
     }
 
-    response = requests.post(url, json=payload, headers=headers, timeout=60)
-    if response.status_code >= 400:
-        raise RuntimeError(f"Responses API error ({response.status_code}): {response.text}")
 
-    data = response.json()
+def _responses_output_text(data) -> str:
     if isinstance(data, dict) and data.get("output_text"):
         return data["output_text"]
 
@@ -322,6 +536,106 @@ def _call_responses_api(
     return "\n".join(text_chunks).strip()
 
 
+def _parse_llm_json(result_text: str) -> Dict:
+    # Both payloads request JSON mode, but keep tolerating fenced output from
+    # models/proxies that ignore it
+    # Extract JSON from response (handle markdown code blocks)
+    if "```json" in result_text:
+        result_text = result_text.split("```json")[1].split("```")[0].strip()
+    elif "```" in result_text:
+        result_text = result_text.split("```")[1].split("```")[0].strip()
+
+    return _json_loads(result_text)
+
+
+def _get_http_client() -> httpx.Client:
+    """
+    Return the process-wide HTTP client used for every OpenAI request.
+
+    Sharing one pool keeps TLS connections alive across clusters and videos
+    instead of handshaking per OpenAI() instance. Sized for
+    LLM_MAX_CONCURRENCY parallel calls; HTTP/2 when `h2` is installed.
+    """
+    global _http_client
+    if _http_client is None:
+        with _http_client_lock:
+            if _http_client is None:
+                _http_client = httpx.Client(
+                    http2=_HTTP2_AVAILABLE,
+                    timeout=httpx.Timeout(60.0, connect=10.0),
+                    limits=httpx.Limits(
+                        max_connections=LLM_MAX_CONCURRENCY,
+                        max_keepalive_connections=LLM_MAX_CONCURRENCY
+                    )
+                )
+    return _http_client
+
+
+def _openai_client(api_key: str, max_retries: int = 2, timeout: float = 600.0) -> OpenAI:
+    """
+    Build an OpenAI client on the shared connection pool.
+
+    The wrapper itself is cheap; the pool is what keeps connections warm.
+    Defaults match the SDK's.
+    """
+    return OpenAI(
+        api_key=api_key,
+        http_client=_get_http_client(),
+        max_retries=max_retries,
+        timeout=timeout
+    )
+
+
+class _ResponsesAPIError(RuntimeError):
+    """Error status from the Responses API; keeps the response for its headers."""
+
+    def __init__(self, response: httpx.Response):
+        super().__init__(f"Responses API error ({response.status_code}): {response.text}")
+        self.response = response
+
+
+def _retry_delay(attempt: int, error: Exception) -> float:
+    """
+    Backoff before retry number attempt + 1.
+
+    Exponential with jitter so concurrent cluster calls that failed together
+    don't retry in lockstep. A Retry-After header on the error's response
+    (OpenAI SDK errors and _ResponsesAPIError both carry one) takes
+    precedence, capped at RETRY_AFTER_MAX_SECONDS.
+    """
+    headers = getattr(getattr(error, "response", None), "headers", None) or {}
+    retry_after = headers.get("retry-after")
+    if retry_after:
+        try:
+            return min(max(float(retry_after), 0.0), RETRY_AFTER_MAX_SECONDS)
+        except ValueError:
+            pass  # HTTP-date form; fall back to backoff
+    return DEFAULT_RETRY_DELAY * (2 ** attempt) * (0.5 + random.random())
+
+
+def _call_responses_api(
+    model: str,
+    api_key: str,
+    prompt: str,
+    temperature: float,
+    max_output_tokens: int
+) -> str:
+    url = "https://api.openai.com/v1/responses"
+    payload = _responses_payload(model, prompt, temperature, max_output_tokens)
+    headers = {
+        "Authorization": f"Bearer {api_key}",
+        "Content-Type": "application/json",
+    }
+
+    response = _get_http_client().post(
+        url, content=_json_dumps(payload), headers=headers, timeout=60
+    )
+    if response.status_code >= 400:
+        raise _ResponsesAPIError(response)
+
+    return _responses_output_text(_json_loads(response.content))
+
+
 def analyze_retake_cuts(
     transcript_words: List[Dict],
     retake_matches: List[Dict],
@@ -330,7 +644,10 @@ def analyze_retake_cuts(
     min_confidence: float = DEFAULT_MIN_CONFIDENCE,
     prefer_sentence_boundaries: bool = True,
     model: str = "gpt-5.2",
-    vad_segments: Optional[List[Tuple[float, float]]] = None
+    vad_segments: Optional[List[Tuple[float, float]]] = None,
+    use_batch_api: bool = False,
+    use_llm_cache: bool = False,
+    shortcut_quick_fix: bool = False
 ) -> List[Dict]:
     """
     Use OpenAI GPT to analyze transcript and generate intelligent cut instructions.
@@ -348,6 +665,15 @@ def analyze_retake_cuts(
         prefer_sentence_boundaries: Use sentence boundaries for natural cuts (default: True)
         model: OpenAI model to use (default: "gpt-5.2")
         vad_segments: Optional VAD speech segments for better boundary detection
+        use_batch_api: Submit cluster prompts via the OpenAI Batch API (half
+            price, separate rate limits, but may take minutes); clusters
+            without a batch result fall back to direct calls. Blocks for up
+            to BATCH_POLL_TIMEOUT_SECONDS (env LLM_BATCH_POLL_TIMEOUT_SECONDS,
+            default 30 min); requires openai>=1.13
+        use_llm_cache: Reuse validated LLM answers for identical prompts from
+            earlier runs (e.g. reprocessing the same video), see LLM_CACHE_DIR
+        shortcut_quick_fix: Cut lone "quick_fix" markers deterministically from
+            the first word before them, without an LLM call
     
     Returns:
         List of enhanced cut instructions with confidence scores and patterns:
@@ -372,7 +698,13 @@ def analyze_retake_cuts(
         f"{context_window_seconds}s, Min confidence: {min_confidence}"
     )
 
-    client = None if _use_responses_api(model) else OpenAI(api_key=api_key)
+    # _call_llm_for_cluster owns retries (with backoff and fallback); SDK
+    # retries on top would multiply attempts, and a stuck call would hold a
+    # cluster for the SDK's 10 minute default
+    client = (
+        None if _use_responses_api(model)
+        else _openai_client(api_key, max_retries=0, timeout=60.0)
+    )
 
     # Pre-compute sentence boundaries for natural cuts
     sentence_boundaries = []
@@ -384,20 +716,29 @@ def analyze_retake_cuts(
     retake_matches = sorted(retake_matches, key=lambda m: m["start"])
     patterns = []
     pattern_by_start = {}
+    first_word_by_start = {}
+    word_starts = [w["start"] for w in transcript_words]
+    marker_starts = [m["start"] for m in retake_matches]
     for match in retake_matches:
         context_words, _, _ = extract_context_window(
             transcript_words,
             match["start"],
-            context_window_seconds
+            context_window_seconds,
+            word_starts=word_starts
         )
         pattern = detect_retake_pattern(
             context_words,
             match,
             transcript_words,
-            retake_matches=retake_matches
+            retake_matches=retake_matches,
+            marker_starts=marker_starts
         )
         patterns.append(pattern)
         pattern_by_start[match["start"]] = pattern
+        if pattern == "quick_fix":
+            first_word_by_start[match["start"]] = next(
+                w["start"] for w in context_words if w["end"] < match["start"]
+            )
         logger.info(f"  Marker at {match['start']:.2f}s: pattern={pattern}")
 
     clusters = cluster_retake_markers(retake_matches)
@@ -406,8 +747,23 @@ def analyze_retake_cuts(
         f"(gap <= {RETAKE_CLUSTER_MAX_GAP_SECONDS:.1f}s)"
     )
 
-    all_cuts = []
+    # One sorted boundary-time index shared by every fallback lookup below
+    boundary_index = None
+    if prefer_sentence_boundaries and sentence_boundaries:
+        boundary_index = _BoundaryIndex(transcript_words, sentence_boundaries)
+
+    def fallback_for(cluster):
+        return _build_cluster_fallback_cut(
+            transcript_words,
+            cluster,
+            vad_segments=vad_segments,
+            sentence_boundaries=sentence_boundaries if prefer_sentence_boundaries else None,
+            boundary_index=boundary_index
+        )
 
+    # Build every cluster's prompt first so the LLM calls can run concurrently
+    cluster_jobs = []
+    quick_fix_cuts = {}
     for cluster_idx, cluster in enumerate(clusters, start=1):
         cluster_start = cluster[0]["start"]
         cluster_end = cluster[-1]["end"]
@@ -417,7 +773,11 @@ def analyze_retake_cuts(
         cluster_excerpt = build_transcript_excerpt(
             transcript_words,
             context_start,
-            context_end
+            context_end,
+            max_tokens=MAX_EXCERPT_TOKENS,
+            focus_range=(cluster_start, cluster_end),
+            model=model,
+            word_starts=word_starts
         )
 
         cluster_markers = "\n".join(
@@ -436,98 +796,139 @@ def analyze_retake_cuts(
             f"{cluster_start:.2f}s to {cluster_end:.2f}s (pattern={cluster_pattern})"
         )
 
-        if not cluster_excerpt:
-            logger.warning(
-                f"  Cluster {cluster_idx}: empty transcript excerpt; "
-                "using fallback heuristic"
-            )
-            fallback_cut = _build_cluster_fallback_cut(
-                transcript_words,
-                cluster,
-                vad_segments=vad_segments,
-                sentence_boundaries=sentence_boundaries if prefer_sentence_boundaries else None
+        if shortcut_quick_fix and cluster_pattern == "quick_fix":
+            # A few seconds of speech then a marker: the whole lead-in is the
+            # mistake, so there is nothing for the LLM to decide
+            quick_fix_cuts[cluster_idx] = {
+                "start_time": first_word_by_start[cluster_start],
+                "end_time": cluster_end,
+                "reason": "Quick fix: removed short lead-in before retake marker",
+                "confidence": 0.85,
+                "pattern": "quick_fix",
+                "method": "heuristic_shortcut"
+            }
+            logger.info(f"  Cluster {cluster_idx}: quick fix, skipping LLM call")
+
+        prompt = None
+        if cluster_excerpt and cluster_idx not in quick_fix_cuts:
+            prompt = CLUSTER_PROMPT_TEMPLATE.substitute(
+                cluster_excerpt=cluster_excerpt,
+                cluster_markers=cluster_markers,
+                first_marker_start=f"{cluster_start:.2f}",
+                last_marker_end=f"{cluster_end:.2f}",
             )
-            all_cuts.append(fallback_cut)
-            continue
-
-        prompt = f"""You are analyzing a SINGLE cluster of retake markers in a video transcript.
-
-The speaker says retake phrases (like "cut cut") to redo a section. If there are multiple markers in the cluster,
-they represent failed attempts leading up to a final successful take AFTER the last marker.
-
-Your task: choose ONE mistake_start_time so we can remove the entire failed section:
-remove from mistake_start_time → last_marker_end.
-
-Constraints:
-- mistake_start_time MUST be before the first marker start.
-- Prefer sentence boundaries or natural pauses.
-- Keep the last completed thought before the mistake.
-- Do NOT remove content after the last marker end (that is the successful take).
-
-Transcript excerpt (timestamps):
-{cluster_excerpt}
-
-Markers in this cluster:
-{cluster_markers}
+        cluster_jobs.append((cluster_idx, cluster, cluster_pattern, context_start, prompt))
 
-First marker start: {cluster_start:.2f}s
-Last marker end: {cluster_end:.2f}s
-
-Return JSON only:
-{{
-  "mistake_start_time": <float>,
-  "reason": "<short reason>",
-  "confidence": <0-1>
-}}
-"""
+    if quick_fix_cuts:
+        logger.info(
+            f"  Resolved {len(quick_fix_cuts)}/{len(clusters)} cluster(s) without the LLM"
+        )
 
+    cached_results = {}
+    cache_paths = {}
+    pending = [job for job in cluster_jobs if job[4] is not None]
+    if use_llm_cache:
+        for cluster_idx, _, _, _, prompt in pending:
+            cache_paths[cluster_idx] = _llm_cache_path(model, prompt)
+            cached = _load_cached_llm_result(cache_paths[cluster_idx])
+            if cached is not None:
+                cached_results[cluster_idx] = cached
+        if cached_results:
+            logger.info(f"  Reusing cached LLM results for {len(cached_results)} cluster(s)")
+        pending = [job for job in pending if job[0] not in cached_results]
+
+    batch_results = {}
+    if use_batch_api and pending:
         try:
-            result = _call_llm_for_cluster(
+            batch_results = _call_llm_batch(
+                model,
+                api_key,
+                {cluster_idx: prompt for cluster_idx, _, _, _, prompt in pending}
+            )
+        except Exception as e:
+            logger.warning(f"  Batch API failed ({e}); calling LLM per cluster")
+        pending = [job for job in pending if job[0] not in batch_results]
+
+    # Clusters are independent, so overlap their network round-trips
+    llm_futures = {}
+    executor = None
+    if pending:
+        executor = ThreadPoolExecutor(max_workers=min(LLM_MAX_CONCURRENCY, len(pending)))
+        for cluster_idx, _, _, _, prompt in pending:
+            llm_futures[cluster_idx] = executor.submit(
+                _call_llm_for_cluster,
                 client,
                 model,
                 prompt,
                 api_key=api_key,
                 max_retries=DEFAULT_MAX_RETRIES
             )
-            mistake_start = float(result.get("mistake_start_time"))
-            reason = result.get("reason", "LLM-selected mistake start")
-            confidence = float(result.get("confidence", 0.8))
-
-            if mistake_start >= cluster_start - 0.05:
-                raise ValueError(
-                    f"LLM start {mistake_start:.2f}s is not before marker "
-                    f"{cluster_start:.2f}s"
-                )
 
-            if mistake_start < context_start:
-                logger.info(
-                    f"  Cluster {cluster_idx}: clamping mistake start "
-                    f"from {mistake_start:.2f}s to {context_start:.2f}s"
-                )
-                mistake_start = context_start
-
-            all_cuts.append({
-                "start_time": mistake_start,
-                "end_time": cluster_end,
-                "reason": reason,
-                "confidence": confidence,
-                "pattern": cluster_pattern,
-                "method": "llm",
-                "llm_reasoning": reason
-            })
+    all_cuts = []
 
-        except Exception as e:
-            logger.warning(
-                f"  Cluster {cluster_idx}: LLM analysis failed ({e}); "
-                "using fallback heuristic"
-            )
-            fallback_cut = _build_cluster_fallback_cut(
-                transcript_words,
-                cluster,
-                vad_segments=vad_segments,
-                sentence_boundaries=sentence_boundaries if prefer_sentence_boundaries else None
-            )
-            all_cuts.append(fallback_cut)
+    try:
+        for cluster_idx, cluster, cluster_pattern, context_start, prompt in cluster_jobs:
+            cluster_start = cluster[0]["start"]
+            cluster_end = cluster[-1]["end"]
+
+            if cluster_idx in quick_fix_cuts:
+                all_cuts.append(quick_fix_cuts[cluster_idx])
+                continue
+
+            if prompt is None:
+                logger.warning(
+                    f"  Cluster {cluster_idx}: empty transcript excerpt; "
+                    "using fallback heuristic"
+                )
+                all_cuts.append(fallback_for(cluster))
+                continue
+
+            try:
+                if cluster_idx in cached_results:
+                    result = cached_results[cluster_idx]
+                elif cluster_idx in batch_results:
+                    result = batch_results[cluster_idx]
+                else:
+                    result = llm_futures[cluster_idx].result()
+                mistake_start = float(result.get("mistake_start_time"))
+                reason = result.get("reason", "LLM-selected mistake start")
+                confidence = float(result.get("confidence", 0.8))
+
+                if mistake_start >= cluster_start - 0.05:
+                    raise ValueError(
+                        f"LLM start {mistake_start:.2f}s is not before marker "
+                        f"{cluster_start:.2f}s"
+                    )
+
+                if mistake_start < context_start:
+                    logger.info(
+                        f"  Cluster {cluster_idx}: clamping mistake start "
+                        f"from {mistake_start:.2f}s to {context_start:.2f}s"
+                    )
+                    mistake_start = context_start
+
+                if cluster_idx in cache_paths and cluster_idx not in cached_results:
+                    _store_llm_result(cache_paths[cluster_idx], result)
+
+                all_cuts.append({
+                    "start_time": mistake_start,
+                    "end_time": cluster_end,
+                    "reason": reason,
+                    "confidence": confidence,
+                    "pattern": cluster_pattern,
+                    "method": "llm",
+                    "llm_reasoning": reason
+                })
+
+            except Exception as e:
+                logger.warning(
+                    f"  Cluster {cluster_idx}: LLM analysis failed ({e}); "
+                    "using fallback heuristic"
+                )
+                all_cuts.append(fallback_for(cluster))
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=True)
 
     if min_confidence > 0:
         original_count = len(all_cuts)
@@ -547,7 +948,8 @@ Return JSON only:
         retake_matches,
         patterns,
         vad_segments=vad_segments,
-        sentence_boundaries=sentence_boundaries if prefer_sentence_boundaries else None
+        sentence_boundaries=sentence_boundaries if prefer_sentence_boundaries else None,
+        boundary_index=boundary_index
     )
     
     # Merge overlapping cuts
@@ -564,6 +966,54 @@ Return JSON only:
     return all_cuts
 
 
+def _llm_cache_path(model: str, prompt: str) -> Path:
+    """
+    Return where the LLM answer for this exact request is cached.
+
+    Prompts carry absolute timestamps, so hits only come from the same
+    transcript being analyzed again. The key is the full request body
+    (model, messages, temperature, token cap, response format), so changing
+    any sampling parameter also misses.
+    """
+    if _use_responses_api(model):
+        payload = _responses_payload(
+            model, prompt, temperature=LLM_TEMPERATURE,
+            max_output_tokens=RESPONSES_MAX_OUTPUT_TOKENS
+        )
+    else:
+        payload = _chat_payload(
+            model, prompt, temperature=LLM_TEMPERATURE, max_tokens=CHAT_MAX_TOKENS
+        )
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(json.dumps(payload, sort_keys=True).encode("utf-8"))
+    return LLM_CACHE_DIR / f"{digest.hexdigest()}.json"
+
+
+def _load_cached_llm_result(cache_path: Path) -> Optional[Dict]:
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            result = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return result if isinstance(result, dict) else None
+
+
+def _store_llm_result(cache_path: Path, result: Dict) -> None:
+    """Write an LLM answer to the cache atomically and prune old entries."""
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(result, f)
+        os.replace(tmp_path, cache_path)
+
+        entries = sorted(cache_path.parent.glob("*.json"), key=lambda p: p.stat().st_mtime)
+        for stale in entries[:-LLM_CACHE_MAX_FILES]:
+            stale.unlink(missing_ok=True)
+    except (OSError, TypeError, ValueError) as e:
+        logger.warning(f"Failed to cache LLM result: {e}")
+
+
 def _call_llm_for_cluster(
     client: Optional[OpenAI],
     model: str,
@@ -583,35 +1033,17 @@ def _call_llm_for_cluster(
                     model=model,
                     api_key=api_key,
                     prompt=prompt,
-                    temperature=0.2,
-                    max_output_tokens=1200
+                    temperature=LLM_TEMPERATURE,
+                    max_output_tokens=RESPONSES_MAX_OUTPUT_TOKENS
                 )
                 result_text = response
             else:
                 response = client.chat.completions.create(
-                    model=model,
-                    messages=[
-                        {
-                            "role": "system",
-                            "content": (
-                                "You are an expert video editing assistant. "
-                                "Return JSON only with a precise mistake_start_time."
-                            )
-                        },
-                        {"role": "user", "content": prompt}
-                    ],
-                    temperature=0.2,
-                    max_tokens=1200
+                    **_chat_payload(model, prompt, temperature=LLM_TEMPERATURE, max_tokens=CHAT_MAX_TOKENS)
                 )
                 result_text = response.choices[0].message.content.strip()
 
-            # Extract JSON from response (handle markdown code blocks)
-            if "```json" in result_text:
-                result_text = result_text.split("```json")[1].split("```")[0].strip()
-            elif "```" in result_text:
-                result_text = result_text.split("```")[1].split("```")[0].strip()
-
-            return json.loads(result_text)
+            return _parse_llm_json(result_text)
 
         except json.JSONDecodeError as e:
             last_error = e
@@ -621,18 +1053,100 @@ def _call_llm_for_cluster(
             logger.warning(f"  LLM API error on attempt {attempt + 1}/{max_retries}: {e}")
 
         if attempt < max_retries - 1:
-            delay = DEFAULT_RETRY_DELAY * (2 ** attempt)
-            logger.info(f"  Retrying in {delay}s...")
+            delay = _retry_delay(attempt, last_error)
+            logger.info(f"  Retrying in {delay:.1f}s...")
             time.sleep(delay)
 
     raise Exception(f"LLM call failed after {max_retries} attempts: {last_error}")
 
 
+def _call_llm_batch(model: str, api_key: str, prompts: Dict[int, str]) -> Dict[int, Dict]:
+    """
+    Run cluster prompts through the OpenAI Batch API.
+
+    Returns parsed results keyed like `prompts`; clusters whose line failed
+    or didn't parse are left out so the caller can retry them per call.
+    Raises if the installed SDK has no Batches API, or if the batch can't be
+    created, fails, or doesn't finish within BATCH_POLL_TIMEOUT_SECONDS (the
+    batch is cancelled in that case). Blocks the caller while polling.
+    """
+    client = _openai_client(api_key)
+    if not hasattr(client, "batches"):
+        # openai<1.13 has no client.batches; bail out before uploading anything
+        raise RuntimeError("installed openai SDK does not support the Batch API")
+
+    if _use_responses_api(model):
+        endpoint = "/v1/responses"
+        build_body = lambda prompt: _responses_payload(model, prompt, temperature=LLM_TEMPERATURE, max_output_tokens=RESPONSES_MAX_OUTPUT_TOKENS)
+    else:
+        endpoint = "/v1/chat/completions"
+        build_body = lambda prompt: _chat_payload(model, prompt, temperature=LLM_TEMPERATURE, max_tokens=CHAT_MAX_TOKENS)
+
+    lines = [
+        json.dumps({
+            "custom_id": f"cluster_{idx}",
+            "method": "POST",
+            "url": endpoint,
+            "body": build_body(prompt),
+        })
+        for idx, prompt in prompts.items()
+    ]
+    batch_file = client.files.create(
+        file=("retake_clusters.jsonl", "\n".join(lines).encode("utf-8")),
+        purpose="batch"
+    )
+    try:
+        batch = client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint=endpoint,
+            completion_window="24h"
+        )
+        logger.info(f"  Submitted {len(prompts)} cluster(s) as batch {batch.id}")
+
+        deadline = time.monotonic() + BATCH_POLL_TIMEOUT_SECONDS
+        while batch.status not in ("completed", "failed", "expired", "cancelled"):
+            if time.monotonic() >= deadline:
+                client.batches.cancel(batch.id)
+                raise TimeoutError(f"Batch {batch.id} not finished after {BATCH_POLL_TIMEOUT_SECONDS}s")
+            time.sleep(BATCH_POLL_INTERVAL_SECONDS)
+            batch = client.batches.retrieve(batch.id)
+
+        if batch.status != "completed" or not batch.output_file_id:
+            raise RuntimeError(f"Batch {batch.id} ended with status {batch.status}")
+
+        output_text = client.files.content(batch.output_file_id).text
+    except Exception:
+        # Don't leave the uploaded prompts behind in the account
+        try:
+            client.files.delete(batch_file.id)
+        except Exception as e:
+            logger.warning(f"  Failed to delete batch input file {batch_file.id}: {e}")
+        raise
+
+    results = {}
+    for line in output_text.splitlines():
+        if not line.strip():
+            continue
+        try:
+            item = _json_loads(line)
+            idx = int(item["custom_id"].split("_", 1)[1])
+            body = (item.get("response") or {}).get("body") or {}
+            if _use_responses_api(model):
+                result_text = _responses_output_text(body)
+            else:
+                result_text = body["choices"][0]["message"]["content"].strip()
+            results[idx] = _parse_llm_json(result_text)
+        except (KeyError, IndexError, ValueError, TypeError) as e:
+            logger.warning(f"  Skipping unusable batch result line: {e}")
+    return results
+
+
 def _build_cluster_fallback_cut(
     transcript_words: List[Dict],
     cluster: List[Dict],
     vad_segments: Optional[List[Tuple[float, float]]] = None,
-    sentence_boundaries: Optional[List[int]] = None
+    sentence_boundaries: Optional[List[int]] = None,
+    boundary_index: Optional["_BoundaryIndex"] = None
 ) -> Dict:
     """
     Build a single fallback cut for a cluster using the first marker as anchor.
@@ -643,7 +1157,8 @@ def _build_cluster_fallback_cut(
         transcript_words,
         [first_marker],
         vad_segments=vad_segments,
-        sentence_boundaries=sentence_boundaries
+        sentence_boundaries=sentence_boundaries,
+        boundary_index=boundary_index
     )
     mistake_cut = next(
         (c for c in fallback_cuts if c.get("pattern") != "retake_phrase"),
@@ -666,31 +1181,54 @@ def _build_cluster_fallback_cut(
     }
 
 
-def _cut_overlaps_range(cut: Dict, start_time: float, end_time: float) -> bool:
-    return cut["start_time"] <= end_time and cut["end_time"] >= start_time
-
-
-def _has_phrase_cut(cuts: List[Dict], match: Dict) -> bool:
-    for cut in cuts:
-        if cut.get("cut_kind") == "retake_phrase":
-            return True
-        if _cut_overlaps_range(cut, match["start"], match["end"]):
-            return True
-    return False
+class _CutIndex:
+    """
+    Cut intervals sorted by start time, for O(log C) coverage checks.
 
+    Both coverage questions reduce to "what is the furthest end among cuts
+    starting by time t", answered from a running max of end times.
+    """
 
-def _has_mistake_cut(cuts: List[Dict], match: Dict, min_lookback: float) -> bool:
+    def __init__(self, cuts: List[Dict]):
+        self.kinds = {cut.get("cut_kind") for cut in cuts}
+        intervals = sorted((cut["start_time"], cut["end_time"]) for cut in cuts)
+        self.starts = [start for start, _ in intervals]
+        self.ends = [end for _, end in intervals]
+        self._max_ends = None
+
+    def add(self, cut: Dict) -> None:
+        self.kinds.add(cut.get("cut_kind"))
+        idx = bisect.bisect_right(self.starts, cut["start_time"])
+        self.starts.insert(idx, cut["start_time"])
+        self.ends.insert(idx, cut["end_time"])
+        self._max_ends = None
+
+    def max_end_starting_by(self, time: float) -> Optional[float]:
+        """Return the latest end time of cuts starting at or before time."""
+        count = bisect.bisect_right(self.starts, time)
+        if count == 0:
+            return None
+        if self._max_ends is None:
+            self._max_ends = list(itertools.accumulate(self.ends, max))
+        return self._max_ends[count - 1]
+
+
+def _has_phrase_cut(index: _CutIndex, match: Dict) -> bool:
+    if "retake_phrase" in index.kinds:
+        return True
+    # Some cut overlaps [start, end]
+    max_end = index.max_end_starting_by(match["end"])
+    return max_end is not None and max_end >= match["start"]
+
+
+def _has_mistake_cut(index: _CutIndex, match: Dict, min_lookback: float) -> bool:
+    if "mistake" in index.kinds:
+        return True
+    # Some cut starting at least min_lookback before the marker reaches
+    # (within 0.2s) up to it
     retake_start = match["start"]
-    retake_end = match["end"]
-    for cut in cuts:
-        if cut.get("cut_kind") == "mistake":
-            return True
-        if cut["start_time"] <= retake_start - min_lookback:
-            if _cut_overlaps_range(cut, retake_start, retake_end):
-                return True
-            if cut["end_time"] >= retake_start - 0.2:
-                return True
-    return False
+    max_end = index.max_end_starting_by(retake_start - min_lookback)
+    return max_end is not None and max_end >= retake_start - 0.2
 
 
 def ensure_retake_coverage(
@@ -699,7 +1237,8 @@ def ensure_retake_coverage(
     retake_matches: List[Dict],
     patterns: List[str],
     vad_segments: Optional[List[Tuple[float, float]]] = None,
-    sentence_boundaries: Optional[List[int]] = None
+    sentence_boundaries: Optional[List[int]] = None,
+    boundary_index: Optional["_BoundaryIndex"] = None
 ) -> List[Dict]:
     """
     Ensure each retake marker removes both the mistake segment and the retake phrase.
@@ -708,13 +1247,14 @@ def ensure_retake_coverage(
         return cuts
 
     updated_cuts = list(cuts)
+    cut_index = _CutIndex(updated_cuts)
 
     for idx, match in enumerate(retake_matches):
         pattern = patterns[idx] if idx < len(patterns) else "unknown"
         min_lookback = PATTERN_MIN_LOOKBACK_SECONDS.get(pattern, 0.5)
 
-        has_mistake = _has_mistake_cut(updated_cuts, match, min_lookback)
-        has_phrase = _has_phrase_cut(updated_cuts, match)
+        has_mistake = _has_mistake_cut(cut_index, match, min_lookback)
+        has_phrase = _has_phrase_cut(cut_index, match)
 
         if has_mistake and has_phrase:
             continue
@@ -732,22 +1272,38 @@ def ensure_retake_coverage(
             transcript_words,
             [match],
             vad_segments=vad_segments,
-            sentence_boundaries=sentence_boundaries
+            sentence_boundaries=sentence_boundaries,
+            boundary_index=boundary_index
         )
 
         for fallback_cut in fallback_cuts:
             if fallback_cut["pattern"] == "retake_phrase":
-                if not has_phrase and not _has_phrase_cut(updated_cuts, match):
+                if not has_phrase and not _has_phrase_cut(cut_index, match):
                     updated_cuts.append(fallback_cut)
+                    cut_index.add(fallback_cut)
                     has_phrase = True
             else:
-                if not has_mistake and not _has_mistake_cut(updated_cuts, match, min_lookback):
+                if not has_mistake and not _has_mistake_cut(cut_index, match, min_lookback):
                     updated_cuts.append(fallback_cut)
+                    cut_index.add(fallback_cut)
                     has_mistake = True
 
     return updated_cuts
 
 
+def _merge_group_ids(starts, ends, max_gap):
+    """
+    Assign a merge group to each cut, given start/end arrays sorted by start.
+
+    A cut joins the current group when it starts within max_gap of the group's
+    furthest end time. Since every cut ends after it starts, that is the
+    running maximum of all earlier end times.
+    """
+    furthest_end = np.maximum.accumulate(ends)
+    new_group = starts[1:] > furthest_end[:-1] + max_gap
+    return np.concatenate(([0], np.cumsum(new_group)))
+
+
 def merge_overlapping_cuts(cuts: List[Dict]) -> List[Dict]:
     """
     Merge overlapping or adjacent cut segments.
@@ -761,34 +1317,51 @@ def merge_overlapping_cuts(cuts: List[Dict]) -> List[Dict]:
     if not cuts:
         return []
     
-    # Sort by start time
-    sorted_cuts = sorted(cuts, key=lambda x: x["start_time"])
+    # Sort by start time (stable, so equal starts keep their input order)
+    starts = np.fromiter((c["start_time"] for c in cuts), dtype=np.float64, count=len(cuts))
+    ends = np.fromiter((c["end_time"] for c in cuts), dtype=np.float64, count=len(cuts))
+    order = np.argsort(starts, kind="stable")
+    starts = starts[order]
+    ends = ends[order]
     
-    merged = [sorted_cuts[0].copy()]
+    # Group overlapping or adjacent cuts (within 0.5s) in one numeric pass,
+    # then take each group's end time with a single reduction
+    group_ids = _merge_group_ids(starts, ends, CUT_MERGE_GAP_SECONDS)
+    group_first = np.flatnonzero(np.diff(group_ids, prepend=-1))
+    group_ends = np.maximum.reduceat(ends, group_first)
+    group_sizes = np.diff(group_first, append=len(cuts))
     
-    for current in sorted_cuts[1:]:
-        last = merged[-1]
-        
-        # Check if current overlaps or is adjacent to last (within 0.5s)
-        if current["start_time"] <= last["end_time"] + 0.5:
-            # Merge: extend the end time and combine reasons
-            last["end_time"] = max(last["end_time"], current["end_time"])
-            
-            # Combine reasons if different
-            if current["reason"] not in last["reason"]:
-                last["reason"] = f"{last['reason']} + {current['reason']}"
-            
-            # Use lower confidence
-            if "confidence" in current and "confidence" in last:
-                last["confidence"] = min(last["confidence"], current["confidence"])
-            
-            # Keep reasoning from higher confidence cut
-            if "llm_reasoning" in current and "llm_reasoning" in last:
-                if current.get("confidence", 0) > last.get("confidence", 0):
-                    last["llm_reasoning"] = current["llm_reasoning"]
-        else:
+    merged = []
+    # Distinct reasons per merged cut, in first-seen order; joined once at the end
+    merged_reasons = []
+    
+    for i, group in zip(order.tolist(), group_ids.tolist()):
+        current = cuts[i]
+        if group == len(merged):
             # No overlap, add as new cut
             merged.append(current.copy())
+            merged_reasons.append({current["reason"]: None})
+            if group_sizes[group] > 1:
+                merged[-1]["end_time"] = float(group_ends[group])
+            continue
+        
+        last = merged[-1]
+        
+        # Combine reasons if different
+        merged_reasons[-1].setdefault(current["reason"])
+        
+        # Use lower confidence
+        if "confidence" in current and "confidence" in last:
+            last["confidence"] = min(last["confidence"], current["confidence"])
+        
+        # Keep reasoning from higher confidence cut
+        if "llm_reasoning" in current and "llm_reasoning" in last:
+            if current.get("confidence", 0) > last.get("confidence", 0):
+                last["llm_reasoning"] = current["llm_reasoning"]
+    
+    for cut, reasons in zip(merged, merged_reasons):
+        if len(reasons) > 1:
+            cut["reason"] = " + ".join(reasons)
     
     return merged
 
@@ -797,7 +1370,8 @@ def generate_fallback_cuts(
     transcript_words: List[Dict],
     retake_matches: List[Dict],
     vad_segments: Optional[List[Tuple[float, float]]] = None,
-    sentence_boundaries: Optional[List[int]] = None
+    sentence_boundaries: Optional[List[int]] = None,
+    boundary_index: Optional["_BoundaryIndex"] = None
 ) -> List[Dict]:
     """
     Enhanced fallback heuristic if LLM fails.
@@ -813,6 +1387,8 @@ def generate_fallback_cuts(
         retake_matches: List of retake phrase matches
         vad_segments: Optional VAD speech segments for boundary detection
         sentence_boundaries: Optional pre-computed sentence boundary indices
+        boundary_index: Optional prebuilt index of sentence_boundaries, for
+            callers running the fallback once per marker
     
     Returns:
         List of cut instructions with fallback method marker
@@ -821,6 +1397,14 @@ def generate_fallback_cuts(
     
     logger.info(f"Using enhanced fallback heuristic for {len(retake_matches)} markers")
     
+    if boundary_index is None and sentence_boundaries and transcript_words:
+        boundary_index = _BoundaryIndex(transcript_words, sentence_boundaries)
+    
+    # Silence gaps between consecutive VAD segments, as sorted bounds
+    gap_ends = [seg[1] for seg in vad_segments[:-1]] if vad_segments else []
+    gap_next_starts = [seg[0] for seg in vad_segments[1:]] if vad_segments else []
+    word_ends = None  # built on first use by the density heuristic
+    
     for match in retake_matches:
         retake_start = match["start"]
         retake_end = match["end"]
@@ -830,40 +1414,37 @@ def generate_fallback_cuts(
         
         # Strategy 1: Use sentence boundaries if available
         mistake_start = None
-        if sentence_boundaries and transcript_words:
-            # Find nearest sentence boundary before retake
-            for boundary_idx in reversed(sentence_boundaries):
-                if boundary_idx < len(transcript_words):
-                    boundary_time = transcript_words[boundary_idx]["end"]
-                    # Look for boundaries within reasonable range (2-30 seconds)
-                    if 2.0 <= (retake_start - boundary_time) <= 30.0:
-                        mistake_start = boundary_time
-                        logger.info(f"  Fallback: Using sentence boundary at {mistake_start:.2f}s")
-                        break
+        if boundary_index is not None:
+            # Find nearest sentence boundary at least 2s before retake
+            boundary_time = boundary_index.nearest_before(retake_start - 2.0)
+            # Look for boundaries within reasonable range (2-30 seconds)
+            if boundary_time is not None and retake_start - boundary_time <= 30.0:
+                mistake_start = boundary_time
+                logger.info(f"  Fallback: Using sentence boundary at {mistake_start:.2f}s")
         
         # Strategy 2: Use VAD silence gaps if available and no sentence boundary found
-        if mistake_start is None and vad_segments:
-            for i in range(len(vad_segments) - 1):
-                gap_end = vad_segments[i][1]
-                gap_start_next = vad_segments[i + 1][0]
-                
-                # Check if there's a silence gap before the retake
-                if gap_end < retake_start < gap_start_next:
-                    # This retake is after a silence gap
-                    if 2.0 <= (retake_start - gap_end) <= 30.0:
-                        mistake_start = gap_end
-                        logger.info(f"  Fallback: Using VAD gap at {mistake_start:.2f}s")
-                        break
+        if mistake_start is None and gap_ends:
+            # Latest gap that ends before the retake
+            i = bisect.bisect_left(gap_ends, retake_start) - 1
+            
+            # Check if the retake falls inside that silence gap
+            if i >= 0 and retake_start < gap_next_starts[i]:
+                gap_end = gap_ends[i]
+                # This retake is after a silence gap
+                if 2.0 <= (retake_start - gap_end) <= 30.0:
+                    mistake_start = gap_end
+                    logger.info(f"  Fallback: Using VAD gap at {mistake_start:.2f}s")
         
         # Strategy 3: Default heuristic based on speech density
         if mistake_start is None:
             # Calculate word density before retake
-            words_before = [w for w in transcript_words if w["end"] <= retake_start]
+            if word_ends is None:
+                word_ends = [w["end"] for w in transcript_words]
+            words_before_count = bisect.bisect_right(word_ends, retake_start)
             
-            if len(words_before) >= 10:
+            if words_before_count >= 10:
                 # Get last 10 words before retake
-                recent_words = words_before[-10:]
-                time_span = retake_start - recent_words[0]["start"]
+                time_span = retake_start - transcript_words[words_before_count - 10]["start"]
                 words_per_second = 10 / time_span if time_span > 0 else 2.0
                 
                 # Adjust lookback based on speech rate
@@ -912,16 +1493,22 @@ def apply_cuts_to_video(
     input_path: str,
     output_path: str,
     cut_instructions: List[Dict],
-    original_segments: List[tuple]
+    original_segments: List[tuple],
+    video_duration: Optional[float] = None
 ) -> dict:
     """
     Apply LLM-generated cuts to video.
     
+    Keep segments are re-encoded in one ffmpeg pass. Stream-copying the
+    untouched GOPs (smart cut) is opt-in through SMART_CUT and off by default.
+    
     Args:
         input_path: Input video path
         output_path: Output video path
         cut_instructions: List of {start_time, end_time, reason} dicts
         original_segments: Original speech segments from VAD
+        video_duration: Duration of input_path in seconds, if already known
+            (skips the ffprobe call)
     
     Returns:
         Dict with processing stats
@@ -944,13 +1531,16 @@ def apply_cuts_to_video(
     
     # Build keep segments (inverse of cuts)
     # Start with full duration
-    try:
-        from utils.vad_processor import get_duration
+    if video_duration is not None:
+        duration = video_duration
+    else:
+        try:
+            from utils.vad_processor import get_duration
 
-        duration = get_duration(input_path)
-    except Exception as e:
-        logger.error(f"Failed to determine video duration: {e}")
-        return {"success": False, "error": str(e)}
+            duration = get_duration(input_path)
+        except Exception as e:
+            logger.error(f"Failed to determine video duration: {e}")
+            return {"success": False, "error": str(e)}
     
     # Sort cuts by start time
     sorted_cuts = sorted(cut_instructions, key=lambda x: x["start_time"])
@@ -971,9 +1561,14 @@ def apply_cuts_to_video(
     
     logger.info(f"Generated {len(keep_segments)} keep segments from cuts")
     
-    from utils.vad_processor import concatenate_segments
+    from utils.vad_processor import SMART_CUT_ENABLED, concatenate_segments
 
-    concatenate_segments(input_path, keep_segments, output_path)
+    # Smart cut (stream-copy whole GOPs) only when SMART_CUT is set; by
+    # default the keep segments are re-encoded in a single pass
+    concatenate_segments(
+        input_path, keep_segments, output_path,
+        smart_cut=SMART_CUT_ENABLED, duration=duration
+    )
     
     logger.info(f"Cuts applied successfully: {output_path}")
     
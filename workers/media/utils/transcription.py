@@ -160,20 +160,26 @@ def search_transcript_for_phrases(
     """
     matches = []
     
+    # Normalize every word once (lowercase, punctuation removed) instead of
+    # once per phrase per candidate position
+    normalized = [
+        ''.join(c for c in w["word"].strip().lower() if c.isalnum())
+        for w in words
+    ]
+    
     for phrase in phrases:
         phrase_words = phrase.lower().split()
         phrase_len = len(phrase_words)
+        if not phrase_words:
+            continue
 
+        first_word = phrase_words[0]
         for i in range(len(words) - phrase_len + 1):
             # Check if this position matches the phrase
-            match = True
-            for j, target_word in enumerate(phrase_words):
-                actual_word = words[i + j]["word"].strip().lower()
-                # Remove punctuation for comparison
-                actual_word = ''.join(c for c in actual_word if c.isalnum())
-                if actual_word != target_word:
-                    match = False
-                    break
+            match = (
+                normalized[i] == first_word
+                and normalized[i:i + phrase_len] == phrase_words
+            )
 
             if match:
                 # Found a match
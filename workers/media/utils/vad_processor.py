@@ -3,6 +3,8 @@ VAD Processor - Silero VAD-based silence removal.
 
 Ported from Initial Templates - execution/jump_cut_vad.py
 """
+import bisect
+import json
 import subprocess
 import tempfile
 import os
@@ -10,7 +12,8 @@ import re
 import logging
 import shutil
 import threading
-from typing import List, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -21,6 +24,23 @@ _silero_utils = None
 
 _hardware_encoder_available = None
 
+# Patterns for parsing `ffmpeg -i` output when ffprobe is unavailable. Newer
+# ffmpeg prints the container stream id too: "Stream #0:1[0x2](und): Audio:".
+_STREAM_TYPE_RE = re.compile(r"Stream #\d+:\d+(?:\[[^\]]*\])?(?:\([^)]*\))?: (Audio|Video):")
+_DURATION_RE = re.compile(r"Duration:\s*(\d+):(\d+):(\d+(?:\.\d+)?)")
+
+# Smart cut: stream-copy whole GOPs, re-encode only the partial GOPs at each
+# segment edge. Opt-in: the spliced stream carries the edge encoder's SPS/PPS
+# next to the source's, which not every player handles.
+SMART_CUT_ENABLED = os.getenv("SMART_CUT", "").lower() in ("1", "true", "yes")
+# Above this many segments the per-edge encodes stop paying off
+SMART_CUT_MAX_SEGMENTS = 32
+# Segment edges this close to a keyframe are treated as on it
+SMART_CUT_KEYFRAME_TOLERANCE = 0.01
+# The split pass and edge encodes are independent ffmpeg runs; cap how many
+# go at once so a long edit doesn't oversubscribe the CPU or encoder sessions
+SMART_CUT_MAX_WORKERS = min(4, os.cpu_count() or 1)
+
 
 def _check_hardware_encoder_available(encoder: str) -> bool:
     try:
@@ -69,10 +89,11 @@ def _has_stream(input_path: str, stream_selector: str) -> bool:
             text=True,
         )
         combined = f"{result.stderr or ''}\n{result.stdout or ''}"
+        stream_types = set(_STREAM_TYPE_RE.findall(combined))
         if stream_selector == "a":
-            return bool(re.search(r"Stream #\d+:\d+(?:\([^)]*\))?: Audio:", combined))
+            return "Audio" in stream_types
         if stream_selector == "v":
-            return bool(re.search(r"Stream #\d+:\d+(?:\([^)]*\))?: Video:", combined))
+            return "Video" in stream_types
         return True
 
     cmd = [
@@ -251,7 +272,7 @@ def get_duration(video_path: str) -> float:
         text=True,
     )
     combined = f"{result.stderr or ''}\n{result.stdout or ''}"
-    match = re.search(r"Duration:\s*(\d+):(\d+):(\d+(?:\.\d+)?)", combined)
+    match = _DURATION_RE.search(combined)
     if not match:
         tail = "\n".join(combined.strip().splitlines()[-8:])
         raise RuntimeError(
@@ -266,12 +287,298 @@ def get_duration(video_path: str) -> float:
     return hours * 3600 + minutes * 60 + seconds
 
 
+def probe_video_stream(input_path: str) -> Optional[dict]:
+    """
+    Return codec parameters of the first video stream via ffprobe.
+
+    Returns None when ffprobe is missing or probing fails.
+    """
+    ffprobe_path = shutil.which("ffprobe")
+    if not ffprobe_path:
+        return None
+
+    probe = subprocess.run(
+        [
+            ffprobe_path, "-v", "error",
+            "-select_streams", "v:0",
+            "-show_entries",
+            "stream=codec_name,profile,level,pix_fmt,r_frame_rate,time_base,"
+            "sample_aspect_ratio,display_aspect_ratio",
+            "-of", "json",
+            input_path,
+        ],
+        capture_output=True,
+        text=True,
+        timeout=30,
+    )
+    if probe.returncode != 0:
+        return None
+    try:
+        streams = json.loads(probe.stdout).get("streams") or []
+    except ValueError:
+        return None
+    return streams[0] if streams else None
+
+
+# ffprobe H.264 profile names -> libx264 -profile:v values
+_X264_PROFILES = {
+    "Constrained Baseline": "baseline",
+    "Baseline": "baseline",
+    "Main": "main",
+    "High": "high",
+    "High 10": "high10",
+    "High 4:2:2": "high422",
+    "High 4:4:4 Predictive": "high444",
+}
+
+
+def matched_encoder_args(stream: dict) -> Optional[List[str]]:
+    """
+    Build libx264 args whose output can be spliced between copied GOPs.
+
+    Matches the source's profile, level, pixel format, frame rate and aspect
+    ratio (from a probe_video_stream() result) so decoders see a compatible
+    parameter set at each splice. Returns None when the source profile has
+    no libx264 equivalent.
+    """
+    profile = _X264_PROFILES.get(stream.get("profile", ""))
+    if profile is None or not stream.get("pix_fmt"):
+        return None
+
+    args = [
+        "-c:v", "libx264", "-preset", "fast", "-crf", "18",
+        "-profile:v", profile,
+        "-pix_fmt", stream["pix_fmt"],
+    ]
+    level = stream.get("level")
+    if isinstance(level, int) and level > 0:
+        args += ["-level:v", f"{level / 10:.1f}"]
+    frame_rate = stream.get("r_frame_rate")
+    if frame_rate and frame_rate != "0/0":
+        args += ["-r", frame_rate]
+    # -aspect rather than a setsar filter, so callers can add their own graph
+    sar = stream.get("sample_aspect_ratio")
+    dar = stream.get("display_aspect_ratio")
+    if sar and sar not in ("0:1", "1:1") and dar and dar != "0:1":
+        args += ["-aspect", dar]
+    return args
+
+
+def _video_keyframe_times(input_path: str) -> Optional[List[float]]:
+    """
+    Return sorted keyframe timestamps of the first video stream.
+
+    Only packet headers are read, nothing is decoded. Returns None when
+    ffprobe is missing or probing fails.
+    """
+    ffprobe_path = shutil.which("ffprobe")
+    if not ffprobe_path:
+        return None
+
+    packets = subprocess.run(
+        [
+            ffprobe_path, "-v", "error",
+            "-select_streams", "v:0",
+            "-show_entries", "packet=pts_time,flags",
+            "-of", "csv=p=0",
+            input_path,
+        ],
+        capture_output=True,
+        text=True,
+        timeout=300,
+    )
+    if packets.returncode != 0:
+        return None
+
+    keyframes = []
+    for line in packets.stdout.splitlines():
+        pts_time, _, flags = line.partition(",")
+        if "K" in flags:
+            try:
+                keyframes.append(float(pts_time))
+            except ValueError:
+                continue
+    keyframes.sort()
+    return keyframes
+
+
+def _plan_smart_cut(
+    segments: List[Tuple[float, float]],
+    keyframes: List[float]
+) -> List[Tuple[float, float, bool]]:
+    """
+    Split keep segments into (start, end, copy) pieces.
+
+    Each segment's span between its first and last inner keyframe is marked
+    for stream copy; the partial GOPs before and after it are re-encoded.
+    Segments with no whole GOP inside are re-encoded entirely.
+    """
+    tol = SMART_CUT_KEYFRAME_TOLERANCE
+    pieces = []
+    for start, end in segments:
+        i = bisect.bisect_left(keyframes, start - tol)
+        j = bisect.bisect_right(keyframes, end + tol) - 1
+        if i >= len(keyframes) or j < 0 or keyframes[j] - keyframes[i] <= tol:
+            pieces.append((start, end, False))
+            continue
+
+        copy_start, copy_end = keyframes[i], keyframes[j]
+        if copy_start - start > tol:
+            pieces.append((start, copy_start, False))
+        pieces.append((copy_start, copy_end, True))
+        if end - copy_end > tol:
+            pieces.append((copy_end, end, False))
+    return pieces
+
+
+def _concatenate_smart_cut(
+    input_path: str,
+    segments: List[Tuple[float, float]],
+    output_path: str,
+    has_audio: bool
+) -> bool:
+    """
+    Concatenate segments re-encoding only the partial GOPs at their edges.
+
+    The video stream is split at the copy-span keyframes in one stream-copy
+    pass, edge pieces are encoded with libx264 matched to the source stream
+    (matched_encoder_args), and the pieces are joined as MPEG-TS (in-band
+    SPS/PPS). Audio is trimmed and
+    encoded from the original in the final mux, which is cheap next to
+    video. Returns False, leaving output_path untouched, when the input
+    isn't suitable or any step fails; callers then do a full re-encode.
+    """
+    if len(segments) > SMART_CUT_MAX_SEGMENTS:
+        return False
+
+    try:
+        # Pieces are joined as MPEG-TS, so only H.264 sources qualify
+        stream = probe_video_stream(input_path)
+        if not stream or stream.get("codec_name") != "h264":
+            return False
+        encoder_args = matched_encoder_args(stream)
+        if encoder_args is None:
+            return False
+        keyframes = _video_keyframe_times(input_path)
+    except (subprocess.TimeoutExpired, OSError) as e:
+        logger.info(f"Smart cut unavailable ({e}), re-encoding whole video")
+        return False
+    if not keyframes:
+        return False
+
+    plan = _plan_smart_cut(segments, keyframes)
+    if not any(copy for _, _, copy in plan):
+        return False
+
+    split_times = sorted({t for start, end, copy in plan if copy for t in (start, end)})
+    cut_points = [t for t in split_times if t > SMART_CUT_KEYFRAME_TOLERANCE]
+    to_annexb = ["-bsf:v", "h264_mp4toannexb", "-f", "mpegts"]
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        # One copy pass cuts the stream into GOP-aligned chunks; chunk n+1
+        # starts at cut_points[n]. Times are nudged back so a keyframe
+        # printed with rounding still starts its own chunk.
+        chunk_pattern = os.path.join(tmpdir, "chunk_%04d.ts")
+        cmds = [[
+            "ffmpeg", "-y", "-i", input_path,
+            "-map", "0:v:0", "-c", "copy", "-bsf:v", "h264_mp4toannexb",
+            "-f", "segment",
+            "-segment_times", ",".join(f"{t - 0.001:.6f}" for t in cut_points),
+            "-segment_format", "mpegts",
+            "-reset_timestamps", "1",
+            "-loglevel", "error",
+            chunk_pattern,
+        ]]
+
+        pieces = []
+        for n, (start, end, copy) in enumerate(plan):
+            if copy:
+                # A chunk must cover exactly this span
+                idx = split_times.index(start)
+                if idx + 1 >= len(split_times) or split_times[idx + 1] != end:
+                    return False
+                chunk = cut_points.index(start) + 1 if start in cut_points else 0
+                pieces.append(chunk_pattern % chunk)
+                continue
+
+            piece_path = os.path.join(tmpdir, f"edge_{n:04d}.ts")
+            cmds.append([
+                "ffmpeg", "-y",
+                "-ss", f"{start:.6f}", "-t", f"{end - start:.6f}", "-i", input_path,
+                "-map", "0:v:0",
+            ] + encoder_args + to_annexb + ["-loglevel", "error", piece_path])
+            pieces.append(piece_path)
+
+        list_path = os.path.join(tmpdir, "concat.txt")
+        with open(list_path, "w") as f:
+            for piece in pieces:
+                f.write(f"file '{piece}'\n")
+
+        final_cmd = ["ffmpeg", "-y", "-f", "concat", "-safe", "0", "-i", list_path]
+        if has_audio:
+            audio_lines = [
+                f"[1:a]atrim=start={start:.6f}:end={end:.6f},asetpts=PTS-STARTPTS[a{i}];"
+                for i, (start, end) in enumerate(segments)
+            ]
+            audio_lines.append(
+                f"{''.join(f'[a{i}]' for i in range(len(segments)))}"
+                f"concat=n={len(segments)}:v=0:a=1[outa]"
+            )
+            audio_script = os.path.join(tmpdir, "audio_filter.txt")
+            with open(audio_script, "w") as f:
+                f.write("\n".join(audio_lines))
+            final_cmd += [
+                "-i", input_path,
+                "-filter_complex_script", audio_script,
+                "-map", "0:v", "-map", "[outa]",
+                "-c:v", "copy", "-c:a", "aac", "-b:a", "192k",
+            ]
+        else:
+            final_cmd += ["-map", "0:v", "-c", "copy"]
+        # Keep the source timescale so copied packet timestamps stay exact
+        time_base = stream.get("time_base", "")
+        if time_base.startswith("1/"):
+            final_cmd += ["-video_track_timescale", time_base[2:]]
+        final_cmd += ["-movflags", "+faststart", "-loglevel", "error", output_path]
+        cmds.append(final_cmd)
+
+        # Split and edge encodes run concurrently; the mux needs all of them
+        def run(cmd):
+            return subprocess.run(cmd, capture_output=True, text=True)
+
+        with ThreadPoolExecutor(max_workers=SMART_CUT_MAX_WORKERS) as pool:
+            results = list(pool.map(run, cmds[:-1]))
+        if all(r.returncode == 0 for r in results):
+            results.append(run(final_cmd))
+        failed = next((r for r in results if r.returncode != 0), None)
+        if failed is not None:
+            logger.warning(f"Smart cut failed, re-encoding whole video: {failed.stderr[-500:]}")
+            if os.path.exists(output_path):
+                os.remove(output_path)
+            return False
+
+    encoded = sum(end - start for start, end, copy in plan if not copy)
+    total = sum(end - start for start, end in segments)
+    logger.info(f"Smart cut: re-encoded {encoded:.2f}s of {total:.2f}s, stream-copied the rest")
+    return True
+
+
 def concatenate_segments(
     input_path: str,
     segments: List[Tuple[float, float]],
-    output_path: str
+    output_path: str,
+    smart_cut: bool = False,
+    duration: Optional[float] = None
 ):
-    """Extract and concatenate video segments using a single FFmpeg pass."""
+    """
+    Extract and concatenate video segments using a single FFmpeg pass.
+
+    With smart_cut, H.264 inputs are first tried with stream copy for whole
+    GOPs (see _concatenate_smart_cut). Worth it for a few long segments,
+    such as retake removal; not for hundreds of short VAD segments. Callers
+    gate it on SMART_CUT_ENABLED.
+    Pass duration when the caller already knows it to skip a probe.
+    """
     if not segments:
         # No cuts needed, just copy
         subprocess.run(
@@ -284,7 +591,8 @@ def concatenate_segments(
     logger.info(f"Concatenating {len(segments)} segments...")
 
     try:
-        duration = get_duration(input_path)
+        if duration is None:
+            duration = get_duration(input_path)
         if (
             len(segments) == 1
             and segments[0][0] <= 0.001
@@ -301,6 +609,10 @@ def concatenate_segments(
 
     has_audio = _has_stream(input_path, "a")
 
+    if smart_cut and _concatenate_smart_cut(input_path, segments, output_path, has_audio):
+        logger.info(f"Concatenation complete: {output_path}")
+        return
+
     filter_lines: list[str] = []
     concat_inputs: list[str] = []
     for i, (start, end) in enumerate(segments):
@@ -444,7 +756,7 @@ def process_video_vad(
 
     # Concatenate
     try:
-        concatenate_segments(input_path, speech_segments, output_path)
+        concatenate_segments(input_path, speech_segments, output_path, duration=duration)
     except FileNotFoundError as e:
         if e.filename in ("ffmpeg", "ffprobe"):
             return {
@@ -74,7 +74,7 @@ source = source_file.read_text()
 checks = [
     ("check_remotion_available()", "check_remotion_available()" in source),
     ("subprocess.run with capture_output", "capture_output=True" in source),
-    ("FFmpeg overlay filter", "overlay=enable=" in source),
+    ("FFmpeg overlay filter", "overlay=eof_action=pass" in source),
     ("Audio copy (-c:a copy)", '"-c:a", "copy"' in source),
     ("Graceful fallback on error", "except Exception" in source),
     ("Temporary file cleanup", "os.remove" in source),
@@ -99,10 +99,10 @@ else:
     print("   ❌ Overlay filter not found or incorrect")
     all_passed = False
 
-if "enable='between(t," in source:
-    print("   ✅ Correct time-based overlay enable syntax")
+if "eof_action=pass" in source:
+    print("   ✅ Overlay limited to the transition's time range")
 else:
-    print("   ❌ Time-based overlay not found")
+    print("   ❌ Time-limited overlay not found")
     all_passed = False
 
 if "setpts=PTS-STARTPTS" in source: